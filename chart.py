@@ -1,45 +1,243 @@
 import os
+import random
+import re
+import base64
+import contextlib
+import functools
+import hashlib
 import subprocess
+import tempfile
+import threading
 import tarfile
 import boto3
+from botocore.config import Config
 import logging
-from botocore.exceptions import ClientError
+from botocore.exceptions import BotoCoreError, ClientError
+import yaml
 from ruamel.yaml import YAML
 import json
 from pathlib import Path
 import time
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse
 from colorama import Fore, Style, init as colorama_init
 
+try:
+    import fcntl
+except ImportError:  # non-POSIX platforms: the chart cache runs without cross-process locking
+    fcntl = None
+
 # Console color setup
 colorama_init(autoreset=True)
 
+# Read-only YAML parsing uses libyaml when available; ruamel is kept for round-trip writes
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Rendered helm output: document separators, and keys that can carry an image reference.
+# Only documents containing one of these keys are YAML-parsed for image extraction.
+_YAML_DOC_SEPARATOR_RE = re.compile(r"^---[ \t]*(?:#.*)?$", re.M)
+# Top-level 'version:' line of a Chart.yaml document (dependency versions are indented)
+_CHART_VERSION_RE = re.compile(r"""^version:[ \t]*["']?([^\s"'#]+)""", re.M)
+
+
+def _chart_version(chart_yaml_text: str):
+    """
+    Chart version from Chart.yaml text (e.g. 'helm show chart' output). Reads the top-level
+    version line directly and only falls back to a full YAML parse if it is not found.
+    """
+    match = _CHART_VERSION_RE.search(chart_yaml_text or "")
+    if match:
+        return match.group(1)
+    chart_info = yaml.load(chart_yaml_text, Loader=_YAML_LOADER) or {}
+    return chart_info.get("version") if isinstance(chart_info, dict) else None
+
+
+# Matches block-style keys as well as quoted JSON/flow-style keys ({"image": ...}) anywhere on a line
+_IMAGE_KEY_RE = re.compile(r"""["']?(?:image|imageRepository|repository)["']?[ \t]*:""")
+
+
+def _parse_image_documents(rendered: str, chart_name: str = "") -> list:
+    """
+    Parse the rendered documents of helm template output that may carry an image reference.
+    Documents without any image/repository key are skipped without being parsed;
+    unparsable documents are logged and skipped.
+    """
+    docs = []
+    for chunk in _YAML_DOC_SEPARATOR_RE.split(rendered):
+        if not _IMAGE_KEY_RE.search(chunk):
+            continue
+        try:
+            docs.append(yaml.load(chunk, Loader=_YAML_LOADER))
+        except Exception:
+            logger.warning("Unable to parse a rendered manifest of %s; skipping it for image extraction", chart_name)
+    return docs
+
+# Registry hosts that serve Docker Hub images
+_DOCKERHUB_HOSTS = frozenset({"docker.io", "index.docker.io", "registry-1.docker.io"})
+_PUBLIC_ECR_HOST = "public.ecr.aws"
+# Registry host -> credential class used for the up-front logins
+_REGISTRY_HOST_CLASSES = {_PUBLIC_ECR_HOST: "public_ecr", **dict.fromkeys(_DOCKERHUB_HOSTS, "dockerhub")}
+
+
+@functools.lru_cache(maxsize=4096)
+def _image_registry_host(image: str) -> str:
+    """
+    Registry host of an image ref; refs without an explicit registry resolve to docker.io.
+    Cached: the same refs are classified during login, validation and copy.
+    """
+    slash = image.find("/")
+    if slash < 0:
+        return "docker.io"
+    first = image[:slash]
+    if "." in first or ":" in first or first == "localhost":
+        return first.lower()
+    return "docker.io"
+
+
+def _is_prerelease(version: str) -> bool:
+    """
+    SemVer prerelease check: a '-' before any '+build' metadata (1.2.3+build-7 is a release).
+    """
+    return "-" in version.split("+", 1)[0]
+
+
+def _newest_stable_version(versions: list) -> str:
+    """
+    First (newest) non-prerelease entry of a newest-first version list, or the newest
+    entry when every version is a prerelease.
+    """
+    stable = [v for v in versions if not _is_prerelease(v)]
+    return (stable or versions)[0]
+
+
+def _exact_search_versions(entries, chart_ref: str) -> list:
+    """
+    Versions from 'helm search repo -o json' entries whose name is exactly chart_ref.
+    'search repo' matches by substring (e.g. redis also matches redis-cluster).
+    """
+    return [str(e.get("version")) for e in entries if isinstance(e, dict) and e.get("name") == chart_ref and e.get("version")]
+
+
+def _repository_host(url: str) -> str:
+    """
+    Host of a chart repository location (oci://, https:// or bare host/path).
+    """
+    rest = url.split("://", 1)[1] if "://" in url else url
+    return rest.split("/", 1)[0].lower()
+
+# Characters not allowed in derived helm repo names (alphanumerics, '-' and '_' are kept)
+_REPO_NAME_UNSAFE_RE = re.compile(r"[^\w-]")
+
+# Upper bound on concurrent crane copies per chart (override with AIRGAP_PUSH_CONCURRENCY)
+try:
+    _MAX_COPY_WORKERS = max(1, int(os.environ.get("AIRGAP_PUSH_CONCURRENCY", "8")))
+except ValueError:
+    _MAX_COPY_WORKERS = 8
+# Lifetime (seconds) of a cached crane manifest (override with AIRGAP_MANIFEST_TTL_S);
+# 0 keeps manifests for the whole run
+try:
+    _MANIFEST_CACHE_TTL_SECONDS = max(0.0, float(os.environ.get("AIRGAP_MANIFEST_TTL_S", "0")))
+except ValueError:
+    _MANIFEST_CACHE_TTL_SECONDS = 0.0
+# Upper bound on concurrent manifest fetches (small registry GETs) per chart
+_MAX_MANIFEST_WORKERS = 16
+# Upper bound on concurrent ECR control-plane calls (e.g. create_repository fan-out)
+_MAX_ECR_API_WORKERS = 8
+# batch_get_image accepts at most 100 image ids per call
+_ECR_BATCH_GET_LIMIT = 100
+_ECR_MANIFEST_MEDIA_TYPES = [
+    "application/vnd.oci.image.index.v1+json",
+    "application/vnd.oci.image.manifest.v1+json",
+    "application/vnd.docker.distribution.manifest.list.v2+json",
+    "application/vnd.docker.distribution.manifest.v2+json",
+]
+# Upper bound on concurrent `helm repo add` calls (each downloads a repo index)
+_MAX_HELM_REPO_WORKERS = 8
+# Helm repo indexes younger than this (seconds) are reused without `helm repo update`
+_HELM_INDEX_MAX_AGE = 300
+
+# Use the 'data' extraction filter where tarfile has one (3.12+ and security backports):
+# rejects absolute/escaping members and avoids the no-filter DeprecationWarning path
+_TAR_EXTRACT_KWARGS = {"filter": "data"} if hasattr(tarfile, "data_filter") else {}
+# Read chart archives in 1 MiB chunks instead of tarfile's 10 KiB default record size
+_TAR_READ_BUFSIZE = 1 << 20
+
+# Downloaded chart archives shared across runs and destination folders,
+# laid out as <dir>/<sha256(source|version)>/<chart>-<version>.tgz (source: full OCI ref,
+# or repository URL|chart for classic repositories)
+_CHART_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "airgap-charts",
+    "charts",
+)
+
+# Process-wide AWS lookups shared by all HelmChart instances.
+# Caller identity keyed by (profile, region); ECR passwords keyed by (registry kind, region)
+# and stored with their expiry so they are only re-fetched close to the 12h token lifetime.
+_CALLER_IDENTITY_CACHE = {}
+_ECR_PASSWORD_CACHE = {}
+_ECR_PASSWORD_REFRESH_MARGIN = 600
+_AWS_CACHE_LOCK = threading.Lock()
+# (registry, username, password) triples crane has successfully logged in with in this process
+_CRANE_LOGINS = set()
+# Serializes private ECR re-logins triggered by concurrent copy workers
+_ECR_REAUTH_LOCK = threading.Lock()
+# Private ECR re-logins within this many seconds of the last one are skipped
+_ECR_REAUTH_INTERVAL = 30.0
+# Tags already present per private ECR repository, filled by HelmChart.prefetch_existing_tags;
+# repositories absent from the map have not been listed (or do not exist yet)
+_EXISTING_TAGS = {}
+
+# Shared botocore settings for all AWS clients: adaptive client-side retries, short
+# connect/read timeouts so a stalled connection is retried instead of hanging a worker, and a
+# connection pool large enough for the concurrent ECR fan-outs (copy workers plus
+# control-plane workers), so threads reuse kept-alive connections instead of opening new ones.
+_AWS_CLIENT_CONFIG = Config(
+    retries={"mode": "adaptive", "max_attempts": 10},
+    connect_timeout=3,
+    read_timeout=10,
+    max_pool_connections=_MAX_COPY_WORKERS + _MAX_ECR_API_WORKERS,
+    tcp_keepalive=True,
+)
+
 # Global logging context
 _CURRENT_ADDON = None
 _CURRENT_INDENT = 0
+# Per-thread override of the logging context (worker threads handling different addons)
+_THREAD_LOG_CONTEXT = threading.local()
 
 class _ColorFormatter(logging.Formatter):
+    # Colored level labels, resolved once per level number
+    _LEVEL_LABELS = {}
+    # Pre-built indentation prefixes for the common nesting depths
+    _INDENTS = tuple("  " * i for i in range(8))
+
+    @staticmethod
+    def _level_label(levelno):
+        if levelno >= logging.ERROR:
+            return Fore.RED + "ERROR" + Style.RESET_ALL
+        if levelno >= logging.WARNING:
+            return Fore.YELLOW + "WARN" + Style.RESET_ALL
+        if levelno >= logging.INFO:
+            return Fore.CYAN + "INFO" + Style.RESET_ALL
+        return "DEBUG"
+
     def format(self, record):
         # Level-based color
-        if record.levelno >= logging.ERROR:
-            level_color = Fore.RED + "ERROR" + Style.RESET_ALL
-        elif record.levelno >= logging.WARNING:
-            level_color = Fore.YELLOW + "WARN" + Style.RESET_ALL
-        elif record.levelno >= logging.INFO:
-            level_color = Fore.CYAN + "INFO" + Style.RESET_ALL
-        else:
-            level_color = "DEBUG"
-
-        # Add-on prefix and indentation
-        addon = _CURRENT_ADDON or ""
-        indent_spaces = "  " * max(0, _CURRENT_INDENT)
-        addon_prefix = f"[{addon}] " if addon else ""
-        # Compose message with indentation and addon
+        level_color = self._LEVEL_LABELS.get(record.levelno)
+        if level_color is None:
+            level_color = self._LEVEL_LABELS[record.levelno] = self._level_label(record.levelno)
+
+        # Add-on prefix and indentation (a thread's own context wins over the global one)
+        addon, indent = getattr(_THREAD_LOG_CONTEXT, "context", None) or (_CURRENT_ADDON, _CURRENT_INDENT)
+        indent = max(0, indent)
+        indent_spaces = self._INDENTS[indent] if indent < len(self._INDENTS) else "  " * indent
         original_msg = super().format(record)
-        colored_msg = f"{indent_spaces}{addon_prefix}{original_msg}"
-        # Final line with colored level
-        return f"{level_color}: {colored_msg}"
+        # Final line with colored level, indentation and addon
+        if addon:
+            return f"{level_color}: {indent_spaces}[{addon}] {original_msg}"
+        return f"{level_color}: {indent_spaces}{original_msg}"
 
 def configure_colored_logging():
     """
@@ -71,11 +269,142 @@ def clear_log_context():
     """
     set_log_context(None, 0)
 
+@contextlib.contextmanager
+def thread_log_context(addon: str, indent: int = 0):
+    """
+    Set the log context for the current thread only, restoring the previous one on exit.
+    Used by worker threads that log on behalf of different addons concurrently.
+    """
+    previous = getattr(_THREAD_LOG_CONTEXT, "context", None)
+    _THREAD_LOG_CONTEXT.context = (addon, indent)
+    try:
+        yield
+    finally:
+        _THREAD_LOG_CONTEXT.context = previous
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Failure text (lowercased helm/crane stderr) that retrying cannot fix: auth problems and
+# missing or malformed references. Transient markers win when both appear.
+_PERMANENT_ERROR_MARKERS = (
+    "unauthorized", "denied", "forbidden", "manifest_unknown", "manifest unknown", "name_unknown",
+    "manifest invalid", "manifest_invalid", "not found", "invalid reference", "could not parse reference",
+)
+_TRANSIENT_ERROR_MARKERS = (
+    "toomanyrequests", "too many requests", "throttl", "timeout", "timed out", "connection reset",
+    "connection refused", "unexpected eof", "service unavailable", "bad gateway", "internal server error",
+    " 500 ", " 502 ", " 503 ", " 504 ",
+)
+
+
+def _is_permanent_error(error_text: str) -> bool:
+    """
+    True when a failed helm/crane call will fail the same way on retry.
+    """
+    text = (error_text or "").lower()
+    if any(marker in text for marker in _TRANSIENT_ERROR_MARKERS):
+        return False
+    return any(marker in text for marker in _PERMANENT_ERROR_MARKERS)
+
+
+# Retry backoff ceiling (seconds) for registry operations
+_RETRY_BACKOFF_CAP = 30.0
+# Wall-clock budget (seconds) for retrying one image copy or chart push
+# (override with AIRGAP_PUSH_DEADLINE_S); no new attempt starts once it is spent
+try:
+    _PUSH_DEADLINE_SECONDS = max(0.0, float(os.environ.get("AIRGAP_PUSH_DEADLINE_S", "300")))
+except ValueError:
+    _PUSH_DEADLINE_SECONDS = 300.0
+
+
+def _backoff_delay(attempt: int, base: float, cap: float = _RETRY_BACKOFF_CAP) -> float:
+    """
+    Exponential backoff with full jitter: uniform in [0, min(cap, base * 2**attempt)].
+    Early retries are quick and concurrent workers don't retry in lockstep.
+    """
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+class _RetryTokenBucket:
+    """
+    Process-wide retry budget shared by all copy/push workers (token bucket refilled over time).
+    Each retry spends tokens; when the bucket is empty, callers fail fast instead of adding
+    to a retry storm against a registry that is already throttling or down.
+    """
+    def __init__(self, capacity: float, refill_per_sec: float):
+        self.capacity = capacity
+        self.refill_per_sec = refill_per_sec
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def try_acquire(self, cost: float = 1.0) -> bool:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.refill_per_sec)
+            self._updated = now
+            if self._tokens < cost:
+                return False
+            self._tokens -= cost
+            return True
+
+
+# Retry budget for image copies and chart pushes: a burst of 10 retries, then about one per second
+_RETRY_BUCKET = _RetryTokenBucket(capacity=50, refill_per_sec=5)
+_RETRY_COST = 5
+
+
+def _decode_output(data: bytes) -> str:
+    """
+    Decode captured subprocess output; undecodable bytes are replaced rather than raising.
+    """
+    return data.decode("utf-8", errors="replace") if data else ""
+
+
+def _write_file_atomic(path: str, content: str, mode: int = 0o600) -> None:
+    """
+    Write content to path via a temp file + os.replace so readers never see a partial file.
+    """
+    tmp = f"{path}.tmp"
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+    try:
+        os.write(fd, content.encode("utf-8"))
+    finally:
+        os.close(fd)
+    os.replace(tmp, path)
+
 class HelmChart:
+    # One boto3 session and one client per (service, region), shared by all instances
+    _aws_session = None
+    _aws_clients = {}
+    # Private ECR repository names, listed once per process and extended as repositories are created
+    _ecr_repository_names = None
+    # Set once the identity is denied batch_get_image/put_image; the retag shortcut is then skipped
+    _ecr_retag_denied = False
+
+    @classmethod
+    def _shared_session(cls):
+        with _AWS_CACHE_LOCK:
+            if cls._aws_session is None:
+                cls._aws_session = boto3.Session()
+            return cls._aws_session
+
+    @classmethod
+    def _shared_client(cls, service, region_name=None):
+        """
+        Return a process-wide boto3 client for (service, region), creating it on first use.
+        """
+        session = cls._shared_session()
+        key = (service, region_name)
+        with _AWS_CACHE_LOCK:
+            client = cls._aws_clients.get(key)
+            if client is None:
+                client = session.client(service, region_name=region_name, config=_AWS_CLIENT_CONFIG)
+                cls._aws_clients[key] = client
+            return client
+
     def __init__(self, addon_chart, addon_chart_version, addon_chart_repository, addon_chart_repository_namespace, addon_chart_release_name, latest=False):
         """
         Initializes the HelmChart with necessary chart details and AWS ECR client.
@@ -94,8 +423,9 @@ class HelmChart:
         self.addon_chart_release_name = addon_chart_release_name
         self.public_addon_chart_images = []
         self.private_addon_chart_images = []
-        self.failed_pull_addon_chart_images = []
-        self.failed_push_addon_chart_images = []
+        # Failed refs/chart files as sets: retries and fallback paths may report the same one twice
+        self.failed_pull_addon_chart_images = set()
+        self.failed_push_addon_chart_images = set()
         self.failed_push_addon_chart = None
         self.failed_commands = []
         self.private_ecr_url = None
@@ -107,12 +437,30 @@ class HelmChart:
         self.repository_prefix = ""
         # Captured dependency tree for logging/summary
         self.dependencies = None
-
-        # Initialize boto3 session and clients once
-        self.session = boto3.Session()
+        # Source digests resolved via crane during this run, keyed by image ref
+        self._src_digest_cache = {}
+        # (fetch time, parsed crane manifest) keyed by image ref (successful fetches only)
+        self._manifest_cache = {}
+        # Parsed Chart.yaml files keyed by (real path, mtime, size)
+        self._chart_yaml_cache = {}
+        # (registry, password) pairs the sandboxed helm is already logged in with
+        self._helm_logins = set()
+        # Private ECR repositories created by this run (known to be empty)
+        self._new_ecr_repos = set()
+        # Existing private ECR tag digests prefetched in batches, keyed by (repo, tag); None = absent
+        self._ecr_tag_digests = {}
+        # Environment for helm subprocesses, built once on first use
+        self._helm_env = None
+        # (registry config, repository config, repository cache) once the helm sandbox exists
+        self._helm_sandbox_paths = None
+        # (pull_latest, version) resolved ahead of time by prefetch_chart; consumed by get_remote_version
+        self._prefetched_version = None
+
+        # Reuse the process-wide boto3 session and clients (credentials resolved once, pooled connections)
+        self.session = self._shared_session()
         self.region = self.session.region_name
-        self.sts_client = self.session.client("sts")
-        self.ecr_client = self.session.client("ecr", region_name=self.region)
+        self.sts_client = self._shared_client("sts")
+        self.ecr_client = self._shared_client("ecr", self.region)
 
     def run_command(self, command, error_message):
         """
@@ -126,146 +474,206 @@ class HelmChart:
             str: The standard output from the command, or None if the command failed.
         """
         try:
-            result = subprocess.run(command, capture_output=True, text=True)
+            result = subprocess.run(command, capture_output=True, stdin=subprocess.DEVNULL)
         except FileNotFoundError as e:
             missing = command[0] if command else "unknown"
             logger.error(f"Missing dependency: '{missing}' not found on PATH while running: {command}. {error_message}")
             self.failed_commands.append((command, error_message, str(e)))
             return None
         if result.returncode != 0:
-            stderr = result.stderr.lower()
+            stderr_lower = result.stderr.lower()
             # Handle specific known errors
-            if "no repo named" in stderr:
+            if b"no repo named" in stderr_lower:
                 logger.warning("Helm repository 'temp' does not exist. Skipping removal.")
-            elif "repository not found" in stderr or "could not resolve host" in stderr:
-                logger.warning(f"Remote repository not found or unable to resolve host: {result.stderr}")
-                self.failed_commands.append((command, error_message, result.stderr))
+                return None
+            stderr = _decode_output(result.stderr)
+            if b"repository not found" in stderr_lower or b"could not resolve host" in stderr_lower:
+                logger.warning(f"Remote repository not found or unable to resolve host: {stderr}")
             else:
-                logger.warning(f"{error_message}: {result.stderr}")
-                self.failed_commands.append((command, error_message, result.stderr))
+                logger.warning(f"{error_message}: {stderr}")
+            self.failed_commands.append((command, error_message, stderr))
             return None
-        return result.stdout
+        return _decode_output(result.stdout)
 
     def _ensure_helm_sandbox(self):
         """
         Ensure per-addon helm registry/repository sandbox paths exist and return them.
+        The paths are created once per instance and memoized for later run_helm calls.
         """
+        if self._helm_sandbox_paths is not None:
+            return self._helm_sandbox_paths
         base = os.path.join(".helm-sandbox", self.addon_chart)
         reg = os.path.join(base, "registry.json")
         repo = os.path.join(base, "repositories.yaml")
         cache = os.path.join(base, "cache")
         cfg = os.path.join(base, "config")
         data = os.path.join(base, "data")
-        os.makedirs(base, exist_ok=True)
-        os.makedirs(cache, exist_ok=True)
-        os.makedirs(cfg, exist_ok=True)
-        os.makedirs(data, exist_ok=True)
-        if not os.path.exists(reg):
+        # makedirs creates base along the way
+        for path in (cache, cfg, data):
+            os.makedirs(path, exist_ok=True)
+        # Seed empty configs only when missing (or left empty by an interrupted run)
+        if not os.path.exists(reg) or os.path.getsize(reg) == 0:
             try:
-                with open(reg, "w", encoding="utf-8") as f:
-                    f.write("{}")
+                _write_file_atomic(reg, "{}")
             except Exception as e:
                 logger.warning(f"Unable to initialize helm registry config at {reg}: {e}")
-        if not os.path.exists(repo):
+        if not os.path.exists(repo) or os.path.getsize(repo) == 0:
             try:
-                with open(repo, "w", encoding="utf-8") as f:
-                    f.write("{}")
+                _write_file_atomic(repo, "{}")
             except Exception as e:
                 logger.warning(f"Unable to initialize helm repositories config at {repo}: {e}")
-        return reg, repo, cache
+        self._helm_sandbox_paths = (reg, repo, cache)
+        return self._helm_sandbox_paths
 
-    def run_helm(self, args, error_message, input_text=None, timeout=120, use_repo_flags=True):
+    def run_helm(self, args, error_message, input_text=None, timeout=120, use_repo_flags=True, errors=None, capture_stdout=True):
         """
         Run a helm command using sandboxed registry/repository configs to avoid OS keyring issues.
         args should NOT include the 'helm' prefix, e.g., ['registry', 'login', ...] or ['show', 'chart', ...].
+        If errors (a list) is given, the failure text is appended to it so retry loops can classify it.
+        With capture_stdout=False, stdout is discarded instead of buffered (for commands whose output
+        is never read, e.g. push/pull progress) and "" is returned on success.
         """
         reg, repo, cache = self._ensure_helm_sandbox()
         cmd = ["helm"]
         if use_repo_flags:
             cmd += ["--registry-config", reg, "--repository-config", repo, "--repository-cache", cache]
         cmd += args
-        try:
-            env = os.environ.copy()
+        if self._helm_env is None:
             # Enable OCI features for dependency update/build and registry operations
-            env["HELM_EXPERIMENTAL_OCI"] = "1"
+            self._helm_env = {**os.environ, "HELM_EXPERIMENTAL_OCI": "1"}
+        try:
             result = subprocess.run(
                 cmd,
-                input=input_text,
-                capture_output=True,
-                text=True,
+                input=input_text.encode("utf-8") if input_text is not None else None,
+                stdin=None if input_text is not None else subprocess.DEVNULL,
+                stdout=subprocess.PIPE if capture_stdout else subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 timeout=timeout,
-                env=env
+                env=self._helm_env
             )
         except subprocess.TimeoutExpired as e:
             logger.error(f"Helm command timed out: {cmd}. {error_message}")
             self.failed_commands.append((cmd, error_message, f"timeout: {e}"))
+            if errors is not None:
+                errors.append(f"timeout: {e}")
             return None
         except FileNotFoundError as e:
             missing = cmd[0] if cmd else "unknown"
             logger.error(f"Missing dependency: '{missing}' not found on PATH while running: {cmd}. {error_message}")
             self.failed_commands.append((cmd, error_message, str(e)))
+            if errors is not None:
+                errors.append(f"executable not found: {missing}")
             return None
         if result.returncode != 0:
-            logger.warning(f"{error_message}: {result.stderr}")
-            self.failed_commands.append((cmd, error_message, result.stderr))
+            stderr = _decode_output(result.stderr)
+            logger.warning(f"{error_message}: {stderr}")
+            self.failed_commands.append((cmd, error_message, stderr))
+            if errors is not None:
+                errors.append(stderr)
             return None
-        return result.stdout
+        return _decode_output(result.stdout)
 
     # -------------------------
     # Crane (daemonless) helpers
     # -------------------------
 
-    def run_crane(self, args, error_message, input_text=None, timeout=300):
+    def run_crane(self, args, error_message, input_text=None, timeout=300, errors=None):
         """
         Run a 'crane' command and return stdout on success, None on failure.
+        If errors (a list) is given, the failure text is appended to it so retry loops can classify it.
         """
         cmd = ["crane"] + args
         try:
             result = subprocess.run(
                 cmd,
-                input=input_text,
+                input=input_text.encode("utf-8") if input_text is not None else None,
+                stdin=None if input_text is not None else subprocess.DEVNULL,
                 capture_output=True,
-                text=True,
                 timeout=timeout
             )
         except subprocess.TimeoutExpired as e:
             logger.error(f"Crane command timed out: {cmd}. {error_message}")
             self.failed_commands.append((cmd, error_message, f"timeout: {e}"))
+            if errors is not None:
+                errors.append(f"timeout: {e}")
             return None
         except FileNotFoundError as e:
             missing = cmd[0] if cmd else "unknown"
             logger.error(f"Missing dependency: '{missing}' not found on PATH while running: {cmd}. {error_message}")
             self.failed_commands.append((cmd, error_message, str(e)))
+            if errors is not None:
+                errors.append(f"executable not found: {missing}")
             return None
         if result.returncode != 0:
-            logger.warning(f"{error_message}: {result.stderr}")
-            self.failed_commands.append((cmd, error_message, result.stderr))
+            stderr = _decode_output(result.stderr)
+            logger.warning(f"{error_message}: {stderr}")
+            self.failed_commands.append((cmd, error_message, stderr))
+            if errors is not None:
+                errors.append(stderr)
+            return None
+        return _decode_output(result.stdout)
+
+    def _crane_manifest(self, image: str, error_message: str | None = None, errors=None) -> dict | None:
+        """
+        Fetch and parse an image manifest with 'crane manifest', memoized per image ref.
+        Returns the parsed manifest (empty dict if not JSON) or None if the fetch failed.
+        Failures are not cached so that retries go back to the registry, and entries
+        older than _MANIFEST_CACHE_TTL_SECONDS (when set) are fetched again.
+        """
+        cached = self._manifest_cache.get(image)
+        if cached is not None:
+            fetched_at, manifest = cached
+            if not _MANIFEST_CACHE_TTL_SECONDS or time.monotonic() - fetched_at < _MANIFEST_CACHE_TTL_SECONDS:
+                return manifest
+        out = self.run_crane(["manifest", image], error_message or f"Crane manifest fetch failed for {image}", errors=errors)
+        if out is None:
             return None
-        return result.stdout
+        try:
+            manifest = json.loads(out)
+        except ValueError:
+            manifest = {}
+        if not isinstance(manifest, dict):
+            manifest = {}
+        self._manifest_cache[image] = (time.monotonic(), manifest)
+        return manifest
 
     def _is_dockerhub_image(self, image: str) -> bool:
         """
         Heuristic to detect Docker Hub images (explicit docker.io or implicit short refs).
         """
-        try:
-            first = image.split('/', 1)[0]
-            # If an explicit registry is provided
-            if '.' in first or ':' in first or first == 'localhost':
-                return first in ('docker.io', 'index.docker.io', 'registry-1.docker.io')
-            # No explicit registry => Docker Hub by default
-            return True
-        except Exception:
-            return False
+        return _image_registry_host(image) in _DOCKERHUB_HOSTS
+
+    def _classify_image(self, image: str) -> str:
+        """
+        Classify an image ref by the registry that needs credentials: 'public_ecr', 'dockerhub' or 'other'.
+        """
+        return _REGISTRY_HOST_CLASSES.get(_image_registry_host(image), "other")
+
+    def _authenticate_image_sources(self, images) -> None:
+        """
+        Log in once to every source registry that images need (public ECR, and Docker Hub when
+        credentials are set). Each image is classified in a single pass. Failures are logged and
+        the caller continues unauthenticated; per-image retries surface real access problems.
+        """
+        kinds = {self._classify_image(img) for img in images}
+        if "dockerhub" in kinds and getattr(self, "dockerhub_username", "") and getattr(self, "dockerhub_token", ""):
+            try:
+                self._crane_login_dockerhub()
+            except Exception as e:
+                logger.warning("Docker Hub authentication attempt failed; will continue unauthenticated. Details: %s", e)
+        if "public_ecr" in kinds:
+            logger.info("Public ECR images detected; authenticating to public ECR (crane)")
+            try:
+                self.authenticate_ecr(is_public=True)
+            except Exception as e:
+                logger.warning("Public ECR authentication attempt failed; will continue with retries. Details: %s", e)
 
     def _normalize_image_host(self, image: str) -> str:
         """
         Normalize known public ECR host name typos to the correct hostname.
         """
-        try:
-            if image.startswith("ecr-public.aws.com") or "ecr-public.aws.com/" in image:
-                return image.replace("ecr-public.aws.com", "public.ecr.aws")
-        except Exception:
-            pass
+        if "ecr-public.aws.com" in image:
+            return image.replace("ecr-public.aws.com", "public.ecr.aws", 1)
         return image
 
     # -------------------------
@@ -279,11 +687,19 @@ class HelmChart:
         Returns:
             tuple: AWS account ID and region.
         """
+        key = (self.session.profile_name, self.region)
+        with _AWS_CACHE_LOCK:
+            account_id = _CALLER_IDENTITY_CACHE.get(key)
+        if account_id:
+            return account_id, self.region
         try:
             identity = self.sts_client.get_caller_identity()
             account_id = identity.get("Account")
+            if account_id:
+                with _AWS_CACHE_LOCK:
+                    _CALLER_IDENTITY_CACHE[key] = account_id
             return account_id, self.region
-        except ClientError as e:
+        except (ClientError, BotoCoreError) as e:
             logger.error(f"Unable to get caller identity: {e}")
             raise Exception(f"Unable to get caller identity: {e}")
 
@@ -294,6 +710,33 @@ class HelmChart:
         aws_account_id, region = self.get_aws_account_id_and_region()
         self.private_ecr_url = f"{aws_account_id}.dkr.ecr.{region}.amazonaws.com"
 
+    def _get_ecr_password(self, is_public=False) -> str:
+        """
+        Return an ECR registry password from GetAuthorizationToken (boto3, no aws CLI).
+        Tokens are cached process-wide until shortly before they expire.
+        Raises ClientError/BotoCoreError if the token cannot be obtained.
+        """
+        key = ("public" if is_public else "private", "us-east-1" if is_public else self.region)
+        now = time.time()
+        with _AWS_CACHE_LOCK:
+            cached = _ECR_PASSWORD_CACHE.get(key)
+        if cached and cached[1] - now > _ECR_PASSWORD_REFRESH_MARGIN:
+            return cached[0]
+        if is_public:
+            # ECR Public authorization tokens are only issued from us-east-1
+            resp = self._shared_client("ecr-public", "us-east-1").get_authorization_token()
+            auth = resp.get("authorizationData") or {}
+        else:
+            resp = self.ecr_client.get_authorization_token()
+            auth = (resp.get("authorizationData") or [{}])[0]
+        decoded = base64.b64decode(auth.get("authorizationToken") or "").decode("utf-8")
+        password = decoded.split(":", 1)[1] if ":" in decoded else decoded
+        expires_at = auth.get("expiresAt")
+        expires_ts = expires_at.timestamp() if expires_at else now + 12 * 3600
+        with _AWS_CACHE_LOCK:
+            _ECR_PASSWORD_CACHE[key] = (password, expires_ts)
+        return password
+
     # -------------------------
     # Crane auth (daemonless)
     # -------------------------
@@ -301,16 +744,24 @@ class HelmChart:
     def _crane_auth_login(self, registry: str, username: str, password: str):
         """
         Perform crane auth login to a registry.
+        crane stores credentials in the shared docker config, so a login that already
+        succeeded in this process with the same credentials is not repeated.
         """
-        return self.run_crane(
+        key = (registry, username, password)
+        if key in _CRANE_LOGINS:
+            return ""
+        out = self.run_crane(
             ["auth", "login", registry, "-u", username, "-p", password],
             f"Failed crane auth login to {registry}"
         )
+        if out is not None:
+            _CRANE_LOGINS.add(key)
+        return out
 
     def _crane_login_ecr_public(self):
         """
         Logs in to the public ECR registry using an override password if provided,
-        otherwise falls back to AWS CLI get-login-password.
+        otherwise falls back to an ECR Public authorization token.
         """
         if self.public_ecr_authenticated:
             return
@@ -319,23 +770,19 @@ class HelmChart:
             logger.info("Crane auth to public ECR with provided token")
             self._crane_auth_login("public.ecr.aws", "AWS", override)
         else:
-            auth_cmd = ["aws", "ecr-public", "get-login-password", "--region", "us-east-1"]
             try:
-                auth_output = subprocess.run(auth_cmd, stdout=subprocess.PIPE, check=True, timeout=30)
-                auth_password = auth_output.stdout.decode().strip()
+                auth_password = self._get_ecr_password(is_public=True)
                 logger.info("Crane auth to public ECR with AWS token")
                 self._crane_auth_login("public.ecr.aws", "AWS", auth_password)
-            except subprocess.TimeoutExpired:
-                logger.warning("Timed out obtaining public ECR login password via aws CLI; proceeding without crane auth to public ECR")
-            except subprocess.CalledProcessError as e:
-                logger.warning(f"Failed to obtain public ECR login password via aws CLI; proceeding without crane auth to public ECR: {e}")
+            except (ClientError, BotoCoreError) as e:
+                logger.warning(f"Failed to obtain public ECR authorization token; proceeding without crane auth to public ECR: {e}")
         self.public_ecr_authenticated = True
         logger.info("Authenticated to public.ecr.aws (crane)")
 
     def _crane_login_ecr_private(self):
         """
         Logs in to the private ECR registry using an override password if provided,
-        otherwise falls back to AWS CLI get-login-password.
+        otherwise falls back to an ECR authorization token.
         """
         if self.private_ecr_authenticated:
             return
@@ -346,9 +793,7 @@ class HelmChart:
             logger.info(f"Crane auth to private ECR {self.private_ecr_url} with provided token")
             self._crane_auth_login(self.private_ecr_url, "AWS", override)
         else:
-            auth_cmd = ["aws", "ecr", "get-login-password", "--region", self.region]
-            auth_output = subprocess.run(auth_cmd, stdout=subprocess.PIPE, check=True)
-            auth_password = auth_output.stdout.decode().strip()
+            auth_password = self._get_ecr_password(is_public=False)
             logger.info(f"Crane auth to private ECR {self.private_ecr_url} with AWS token")
             self._crane_auth_login(self.private_ecr_url, "AWS", auth_password)
         self.private_ecr_authenticated = True
@@ -370,6 +815,46 @@ class HelmChart:
         self.dockerhub_authenticated = True
         logger.info("Authenticated to Docker Hub (crane)")
 
+    def _refresh_private_ecr_auth(self, helm: bool = False) -> None:
+        """
+        Drop the cached private ECR token and logins and log in again (crane, or the sandboxed
+        helm when helm is set), e.g. after the token expired mid-run. Concurrent callers share
+        one re-login.
+        """
+        with _ECR_REAUTH_LOCK:
+            now = time.monotonic()
+            if not helm and now - getattr(self, "_private_ecr_reauth_at", float("-inf")) < _ECR_REAUTH_INTERVAL:
+                return
+            with _AWS_CACHE_LOCK:
+                _ECR_PASSWORD_CACHE.pop(("private", self.region), None)
+            registry = self.private_ecr_url
+            if helm:
+                self._helm_logins = {key for key in self._helm_logins if key[0] != registry}
+                self._login_ecr_private_chart()
+            else:
+                for key in [key for key in _CRANE_LOGINS if key[0] == registry]:
+                    _CRANE_LOGINS.discard(key)
+                self.private_ecr_authenticated = False
+                self._crane_login_ecr_private()
+                self._private_ecr_reauth_at = now
+
+    def _is_private_ecr_error(self, error_text: str) -> bool:
+        """
+        True if a registry error names the private ECR destination (rather than a source registry).
+        """
+        return bool(self.private_ecr_url) and self.private_ecr_url.lower() in (error_text or "").lower()
+
+    def _recover_private_ecr_destination(self, repo: str, helm: bool = False) -> None:
+        """
+        Before the single retry of a destination auth/name error: wait for the repository to be
+        visible (it may have just been created) and refresh the private ECR credentials.
+        """
+        self._wait_for_ecr_repository(repo)
+        try:
+            self._refresh_private_ecr_auth(helm=helm)
+        except Exception as e:
+            logger.warning("Unable to refresh private ECR credentials: %s", e)
+
     def authenticate_ecr(self, is_public=False):
         """
         Perform crane authentication to ECR registries.
@@ -379,7 +864,7 @@ class HelmChart:
                 self._crane_login_ecr_public()
             else:
                 self._crane_login_ecr_private()
-        except subprocess.CalledProcessError as e:
+        except (ClientError, BotoCoreError) as e:
             logger.error(f"Failed to authenticate with Amazon ECR via crane: {e}")
             raise e
 
@@ -387,65 +872,123 @@ class HelmChart:
     # Helm registry auth (charts)
     # -------------------------
 
+    def _helm_registry_login(self, registry: str, password: str, error_message: str):
+        """
+        'helm registry login' (sandboxed) as user AWS. The sandbox registry config keeps the
+        credentials, so a login that already succeeded for this chart with the same password is skipped.
+        Returns helm's output, or None if the login failed.
+        """
+        key = (registry, password)
+        if key in self._helm_logins:
+            return ""
+        login_args = ["registry", "login", "--username", "AWS", "--password-stdin", registry]
+        result = self.run_helm(login_args, error_message, input_text=password, use_repo_flags=True, capture_stdout=False)
+        if result is not None:
+            self._helm_logins.add(key)
+        return result
+
+    def _helm_registry_write_auth(self, registry: str, password: str) -> bool:
+        """
+        Store AWS:<password> for registry directly in the sandbox registry config (the docker
+        config.json layout 'helm registry login' writes). Used for passwords just issued by
+        GetAuthorizationToken, which need no validation round-trip, so no helm process or registry
+        ping is spent per chart. Returns False if the config could not be updated.
+        """
+        key = (registry, password)
+        if key in self._helm_logins:
+            return True
+        reg, _, _ = self._ensure_helm_sandbox()
+        try:
+            with open(reg, "r", encoding="utf-8") as f:
+                config = json.load(f)
+        except (OSError, ValueError):
+            config = {}
+        if not isinstance(config, dict):
+            config = {}
+        auths = config.get("auths")
+        if not isinstance(auths, dict):
+            auths = config["auths"] = {}
+        auths[registry] = {"auth": base64.b64encode(f"AWS:{password}".encode("utf-8")).decode("ascii")}
+        try:
+            _write_file_atomic(reg, json.dumps(config, indent=2))
+        except OSError as e:
+            logger.warning(f"Unable to write helm registry credentials to {reg}: {e}")
+            return False
+        self._helm_logins.add(key)
+        return True
+
     def _login_ecr_public_chart(self):
         """
-        Logs in to the public ECR registry for Helm using an override password if provided,
-        otherwise falls back to AWS CLI get-login-password.
+        Logs in to the public ECR registry for Helm using an override password if provided
+        ('helm registry login', which validates it), otherwise stores a cached ECR Public
+        authorization token in the sandbox registry config.
         """
         override = getattr(self, "public_ecr_password", "")
         if override:
-            login_args = ["registry", "login", "--username", "AWS", "--password-stdin", "public.ecr.aws"]
             logger.info("Helm registry login to public ECR (sandboxed) with provided token")
-            result = self.run_helm(login_args, "Failed helm registry login to public.ecr.aws with override", input_text=override, use_repo_flags=True)
+            result = self._helm_registry_login(_PUBLIC_ECR_HOST, override, "Failed helm registry login to public.ecr.aws with override")
             if result is not None:
                 logger.info("Helm logged into public ECR")
         else:
-            auth_cmd = ["aws", "ecr-public", "get-login-password", "--region", "us-east-1"]
             try:
-                auth_output = subprocess.run(auth_cmd, stdout=subprocess.PIPE, check=True, timeout=30)
-                auth_password = auth_output.stdout.decode().strip()
-                login_args = ["registry", "login", "--username", "AWS", "--password-stdin", "public.ecr.aws"]
+                auth_password = self._get_ecr_password(is_public=True)
                 logger.info("Helm registry login to public ECR (sandboxed) with AWS token")
-                result = self.run_helm(login_args, "Failed helm registry login to public.ecr.aws", input_text=auth_password, use_repo_flags=True)
-                if result is not None:
+                if (self._helm_registry_write_auth(_PUBLIC_ECR_HOST, auth_password)
+                        or self._helm_registry_login(_PUBLIC_ECR_HOST, auth_password, "Failed helm registry login to public.ecr.aws") is not None):
                     logger.info("Helm logged into public ECR")
-            except subprocess.TimeoutExpired:
-                logger.warning("Timed out obtaining public ECR login password via aws CLI; attempting helm operations without registry login")
-            except subprocess.CalledProcessError as e:
-                logger.warning(f"Failed to obtain public ECR login password via aws CLI; attempting helm operations without registry login: {e}")
+            except (ClientError, BotoCoreError) as e:
+                logger.warning(f"Failed to obtain public ECR authorization token; attempting helm operations without registry login: {e}")
 
     def _login_ecr_private_chart(self):
         """
-        Logs in to the private ECR registry for Helm using an override password if provided,
-        otherwise falls back to AWS CLI get-login-password.
+        Logs in to the private ECR registry for Helm using an override password if provided
+        ('helm registry login', which validates it), otherwise stores a cached ECR
+        authorization token in the sandbox registry config.
         """
         override = getattr(self, "private_ecr_password", "")
         if override:
-            login_args = ["registry", "login", "--username", "AWS", "--password-stdin", self.private_ecr_url]
             logger.info(f"Helm registry login to private ECR (sandboxed): {self.private_ecr_url}")
-            result = self.run_helm(login_args, f"Failed helm registry login to {self.private_ecr_url} with override", input_text=override, use_repo_flags=True)
+            result = self._helm_registry_login(self.private_ecr_url, override, f"Failed helm registry login to {self.private_ecr_url} with override")
             if result is not None:
                 logger.info("Helm logged into private ECR")
         else:
-            auth_cmd = ["aws", "ecr", "get-login-password", "--region", self.region]
-            auth_output = subprocess.run(auth_cmd, stdout=subprocess.PIPE, check=True)
-            auth_password = auth_output.stdout.decode().strip()
-            login_args = ["registry", "login", "--username", "AWS", "--password-stdin", self.private_ecr_url]
+            auth_password = self._get_ecr_password(is_public=False)
             logger.info(f"Helm registry login to private ECR (sandboxed) with AWS token: {self.private_ecr_url}")
-            result = self.run_helm(login_args, f"Failed helm registry login to {self.private_ecr_url}", input_text=auth_password, use_repo_flags=True)
-            if result is not None:
+            if (self._helm_registry_write_auth(self.private_ecr_url, auth_password)
+                    or self._helm_registry_login(self.private_ecr_url, auth_password, f"Failed helm registry login to {self.private_ecr_url}") is not None):
                 logger.info("Helm logged into private ECR")
 
     # -------------------------
     # Repo/Dependency helpers
     # -------------------------
 
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _oci_chart_info(repository: str, namespace: str, chart: str) -> tuple[bool, str]:
+        """
+        (is OCI, OCI chart ref) for a chart location; cached since every version lookup,
+        download and template step asks again with the same inputs.
+        """
+        is_oci = repository.startswith("oci://") or _repository_host(repository) in (_PUBLIC_ECR_HOST, "ghcr.io") or bool(namespace)
+        repo = repository
+        if repo.startswith("oci://"):
+            repo = repo[len("oci://"):]  # strip scheme, helm expects full oci:// when pulling
+        ns = namespace.strip("/")
+        if ns:
+            return is_oci, f"oci://{repo}/{ns}/{chart}"
+        return is_oci, f"oci://{repo}/{chart}"
+
     def _is_oci_repository(self):
         """
         Determine if the chart repository should be treated as an OCI registry.
         """
-        repo = self.addon_chart_repository or ""
-        return repo.startswith("oci://") or "public.ecr.aws" in repo or "ghcr.io" in repo or bool(self.addon_chart_repository_namespace)
+        return self._oci_chart_info(self.addon_chart_repository or "", self.addon_chart_repository_namespace or "", self.addon_chart)[0]
+
+    def _is_public_ecr_chart_repository(self):
+        """
+        True when the chart is served from public ECR (needs a helm registry login).
+        """
+        return _repository_host(self.addon_chart_repository or "") == _PUBLIC_ECR_HOST
 
     def _build_oci_chart_ref(self):
         """
@@ -453,17 +996,14 @@ class HelmChart:
         oci://public.ecr.aws/karpenter/karpenter
         oci://ghcr.io/grafana/helm-charts/grafana-operator
         """
-        repo = self.addon_chart_repository or ""
-        if repo.startswith("oci://"):
-            repo = repo[len("oci://"):]  # strip scheme, helm expects full oci:// when pulling
-        ns = (self.addon_chart_repository_namespace or "").strip("/")
-        if ns:
-            return f"oci://{repo}/{ns}/{self.addon_chart}"
-        return f"oci://{repo}/{self.addon_chart}"
+        return self._oci_chart_info(self.addon_chart_repository or "", self.addon_chart_repository_namespace or "", self.addon_chart)[1]
 
-    def _derive_repo_name(self, url: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _derive_repo_name(url: str) -> str:
         """
         Derive a stable helm repo name from a URL host/path.
+        Cached: the same dependency URLs recur across charts and subcharts.
         """
         try:
             parsed = urlparse(url)
@@ -471,21 +1011,31 @@ class HelmChart:
             path = (parsed.path or "").strip("/").split("/")
             suffix = path[-1] if path and path[-1] else "charts"
             base = f"{host}-{suffix}".lower()
-            safe = "".join(ch if ch.isalnum() or ch in "-_" else "-" for ch in base)
-            safe = safe.strip("-")
+            safe = _REPO_NAME_UNSAFE_RE.sub("-", base).strip("-")
             return safe or "repo"
         except Exception:
             return "repo"
 
     def _read_chart_yaml(self, chart_root):
-        yaml = YAML()
+        """
+        Parse <chart_root>/Chart.yaml, memoized by (real path, mtime, size) so the several
+        dependency/graph walks over the same chart only parse each file once.
+        The returned dict is shared; callers must not mutate it.
+        """
         chart_yaml_path = os.path.join(chart_root, "Chart.yaml")
         try:
-            with open(chart_yaml_path, "r", encoding="utf-8") as f:
-                return yaml.load(f) or {}
+            st = os.stat(chart_yaml_path)
+            key = (os.path.realpath(chart_yaml_path), st.st_mtime_ns, st.st_size)
+            cached = self._chart_yaml_cache.get(key)
+            if cached is not None:
+                return cached
+            with open(chart_yaml_path, "rb") as f:
+                meta = yaml.load(f, Loader=_YAML_LOADER) or {}
         except Exception as e:
             logger.warning(f"Unable to read Chart.yaml at {chart_yaml_path}: {e}")
             return None
+        self._chart_yaml_cache[key] = meta
+        return meta
 
     def _collect_declared_dependencies(self, chart_root):
         meta = self._read_chart_yaml(chart_root) or {}
@@ -502,23 +1052,67 @@ class HelmChart:
                 })
         return result
 
-    def _collect_vendored_tree(self, chart_root):
-        node = {"name": None, "version": None, "repository": "vendored", "children": []}
+    def _vendored_node(self, chart_root):
         meta = self._read_chart_yaml(chart_root) or {}
-        node["name"] = meta.get("name") or os.path.basename(chart_root)
-        node["version"] = meta.get("version")
+        return {
+            "name": meta.get("name") or os.path.basename(chart_root),
+            "version": meta.get("version"),
+            "repository": "vendored",
+            "children": [],
+        }
+
+    def _collect_vendored_tree(self, chart_root):
+        """
+        Build the tree of vendored subcharts (charts/<sub>/charts/...) without recursion;
+        os.scandir reports directory-ness from the listing itself.
+        """
+        root = self._vendored_node(chart_root)
+        stack = [(chart_root, root)]
+        while stack:
+            path, node = stack.pop()
+            try:
+                with os.scandir(os.path.join(path, "charts")) as entries:
+                    subdirs = [e.path for e in entries if e.is_dir()]
+            except OSError:
+                continue
+            for sub in subdirs:
+                child = self._vendored_node(sub)
+                node["children"].append(child)
+                stack.append((sub, child))
+        return root
+
+    def _vendored_dependencies_satisfied(self, chart_root: str) -> bool:
+        """
+        True when Chart.lock pins every declared dependency and each one is already present under
+        charts/ (as <name>-<version>.tgz or an unpacked <name>/ directory), so 'helm dependency build'
+        would only re-fetch what is on disk.
+        """
+        declared = self._collect_declared_dependencies(chart_root)
+        if not declared:
+            return False
+        lock_path = os.path.join(chart_root, "Chart.lock")
+        try:
+            with open(lock_path, "rb") as f:
+                lock = yaml.load(f, Loader=_YAML_LOADER) or {}
+        except Exception:
+            return False
+        locked = [d for d in (lock.get("dependencies") or []) if isinstance(d, dict)] if isinstance(lock, dict) else []
+        if {d.get("name") for d in declared} - {d.get("name") for d in locked}:
+            return False
         charts_dir = os.path.join(chart_root, "charts")
-        if os.path.isdir(charts_dir):
-            for entry in os.listdir(charts_dir):
-                sub = os.path.join(charts_dir, entry)
-                if os.path.isdir(sub):
-                    node["children"].append(self._collect_vendored_tree(sub))
-        return node
+        for dep in locked:
+            name, version = dep.get("name"), dep.get("version")
+            if not name:
+                return False
+            if not (os.path.isfile(os.path.join(charts_dir, f"{name}-{version}.tgz")) or os.path.isdir(os.path.join(charts_dir, name))):
+                return False
+        return True
 
     def _ensure_helm_repos(self, chart_root: str):
         """
-        Ensure that all http(s) Chart.yaml dependency repositories are added to helm,
-        and update the repo cache if any were added.
+        Ensure that all http(s) Chart.yaml dependency repositories are added to the sandboxed helm,
+        and refresh cached indexes that are stale. Repos that are already registered with the
+        same URL are not re-added.
         """
         declared = self._collect_declared_dependencies(chart_root)
         urls = []
@@ -528,22 +1122,61 @@ class HelmChart:
                 if repo not in urls:
                     urls.append(repo)
 
-        added_any = False
-        for url in urls:
-            name = self._derive_repo_name(url)
+        if not urls:
+            return
+        # Dependency build/update and template all run through the sandboxed helm, so that is the
+        # only repository config that needs these repos ('helm show/pull --repo' need none).
+        names = {url: HelmChart._derive_repo_name(url) for url in urls}
+        _, _, cache_dir = self._ensure_helm_sandbox()
+        existing = self._sandbox_helm_repos()
+
+        # Only add repos that are missing (or registered under the same name with another URL)
+        adds = [url for url in urls if existing.get(names[url]) != url]
+
+        def add_repo(url):
+            name = names[url]
             logger.info(f"Ensuring helm repo '{name}' -> {url}")
-            cmd_add = ["helm", "repo", "add", name, url]
-            # It's fine if this fails due to 'already exists'; run_command will log it.
-            self.run_command(cmd_add, f"Failed to add helm repo {url}")
-            # Also add via sandboxed helm to maintain consistency when OCI is used
-            self.run_helm(["repo", "add", name, url], f"Failed to add helm repo (sandboxed) {url}", use_repo_flags=True)
-            added_any = True
-
-        if added_any:
+            args = ["repo", "add", name, url] + (["--force-update"] if name in existing else [])
+            self.run_helm(args, f"Failed to add helm repo (sandboxed) {url}", use_repo_flags=True, capture_stdout=False)
+
+        # Each add downloads the repo index; helm serializes its own writes to
+        # repositories.yaml with a file lock, so the adds can run concurrently.
+        if adds:
+            with ThreadPoolExecutor(max_workers=min(_MAX_HELM_REPO_WORKERS, len(adds))) as pool:
+                list(pool.map(add_repo, adds))
+
+        # Freshly added repos come with a new index; refresh only the stale ones
+        stale = [names[url] for url in urls if url not in adds and not self._helm_indexes_fresh(cache_dir, [names[url]])]
+        if stale:
             logger.info("Updating helm repo cache...")
-            # Update both standard and sandboxed caches (harmless if one is unused)
-            self.run_command(["helm", "repo", "update"], "Failed to update helm repo cache")
-            self.run_helm(["repo", "update"], "Failed to update helm repo cache (sandboxed)", use_repo_flags=True)
+            self.run_helm(["repo", "update"] + stale, "Failed to update helm repo cache (sandboxed)", use_repo_flags=True, capture_stdout=False)
+
+    def _sandbox_helm_repos(self) -> dict:
+        """
+        Return {name: url} for repositories registered in the sandboxed helm repositories.yaml.
+        """
+        _, repo_config, _ = self._ensure_helm_sandbox()
+        try:
+            with open(repo_config, "rb") as f:
+                data = yaml.load(f, Loader=_YAML_LOADER) or {}
+        except Exception:
+            return {}
+        entries = (data.get("repositories") or []) if isinstance(data, dict) else []
+        return {r.get("name"): r.get("url") for r in entries if isinstance(r, dict)}
+
+    @staticmethod
+    def _helm_indexes_fresh(cache_dir: str, names) -> bool:
+        """
+        True when every '<name>-index.yaml' in cache_dir was refreshed within _HELM_INDEX_MAX_AGE.
+        """
+        now = time.time()
+        for name in names:
+            try:
+                if now - os.path.getmtime(os.path.join(cache_dir, f"{name}-index.yaml")) >= _HELM_INDEX_MAX_AGE:
+                    return False
+            except OSError:
+                return False
+        return True
 
     # -------------------------
     # Chart version + download
@@ -556,15 +1189,18 @@ class HelmChart:
         Returns:
             str: The version that should be used (latest or specified), or None if unavailable.
         """
-        yaml = YAML()
-
+        prefetched = self._prefetched_version
+        if prefetched is not None and prefetched[0] == pull_latest:
+            self._prefetched_version = None
+            logger.info(f"Using version {prefetched[1]} resolved during prefetch for {self.addon_chart}")
+            return prefetched[1]
         # Build helm show chart command depending on repo type
         use_oci = self._is_oci_repository()
         if use_oci:
             chart_ref = self._build_oci_chart_ref()
             logger.info(f"Fetching version for {self.addon_chart} version {self.addon_chart_version} from OCI registry: {chart_ref}")
             # Only login for public ECR; ghcr.io usually doesn't require login to pull public charts
-            if "public.ecr.aws" in (self.addon_chart_repository or ""):
+            if self._is_public_ecr_chart_repository():
                 self._login_ecr_public_chart()
             cmd_show_chart = ["helm", "show", "chart", chart_ref] if pull_latest else ["helm", "show", "chart", chart_ref, "--version", self.addon_chart_version]
         else:
@@ -572,6 +1208,24 @@ class HelmChart:
             cmd_show_chart = ["helm", "show", "chart", self.addon_chart, "--repo", self.addon_chart_repository] if pull_latest else ["helm", "show", "chart", self.addon_chart, "--repo", self.addon_chart_repository, "--version", self.addon_chart_version]
 
         try:
+            # Classic repos: list every version from the (cached) repo index in one call and decide locally
+            versions = None if use_oci else self._repo_chart_versions()
+            if versions:
+                version_latest = _newest_stable_version(versions)
+                if pull_latest:
+                    logger.info(f"The latest version of {self.addon_chart} is {version_latest}")
+                    if version_latest != self.addon_chart_version:
+                        logger.info(f"New version {version_latest} available for {self.addon_chart}, updating...")
+                        self.addon_chart_version = version_latest
+                    return version_latest
+                if self.addon_chart_version in versions:
+                    logger.info(f"The specified version {self.addon_chart_version} of {self.addon_chart} is available.")
+                    return self.addon_chart_version
+                logger.warning(f"Requested version {self.addon_chart_version} for {self.addon_chart} is unavailable or mismatched; attempting to fetch latest.")
+                logger.info(f"Falling back to latest version {version_latest} for {self.addon_chart}")
+                self.addon_chart_version = version_latest
+                return version_latest
+
             # Use sandboxed helm when operating against OCI/public ECR
             if use_oci:
                 args_show = cmd_show_chart[1:]  # drop 'helm'
@@ -580,8 +1234,7 @@ class HelmChart:
                 result = self.run_command(cmd_show_chart, "Failed to fetch chart details")
             if result is None:
                 raise Exception("helm show returned no data")
-            chart_info = yaml.load(result)
-            version = chart_info.get('version')
+            version = _chart_version(result)
 
             if pull_latest:
                 logger.info(f"The latest version of {self.addon_chart} is {version}")
@@ -598,7 +1251,7 @@ class HelmChart:
             logger.warning(f"Requested version {self.addon_chart_version} for {self.addon_chart} is unavailable or mismatched; attempting to fetch latest.")
             # Fetch latest without --version
             if use_oci:
-                if "public.ecr.aws" in (self.addon_chart_repository or ""):
+                if self._is_public_ecr_chart_repository():
                     self._login_ecr_public_chart()
                 cmd_latest = ["helm", "show", "chart", chart_ref]
             else:
@@ -611,8 +1264,7 @@ class HelmChart:
                 result_latest = self.run_command(cmd_latest, "Failed to fetch latest chart details")
             if result_latest is None:
                 return None
-            chart_info_latest = yaml.load(result_latest)
-            version_latest = chart_info_latest.get('version')
+            version_latest = _chart_version(result_latest)
             if version_latest:
                 logger.info(f"Falling back to latest version {version_latest} for {self.addon_chart}")
                 self.addon_chart_version = version_latest
@@ -626,6 +1278,31 @@ class HelmChart:
                 pass
             return None
 
+    def _repo_chart_versions(self):
+        """
+        List the versions of this chart in its classic helm repo, newest first, via the sandboxed
+        repo index (added on first use, refreshed only when stale). Returns None when the repo
+        can't be searched so callers fall back to 'helm show chart'.
+        """
+        url = self.addon_chart_repository or ""
+        if not (url.startswith("http://") or url.startswith("https://")):
+            return None
+        name = HelmChart._derive_repo_name(url)
+        _, _, cache = self._ensure_helm_sandbox()
+        if self._sandbox_helm_repos().get(name) != url:
+            if self.run_helm(["repo", "add", name, url, "--force-update"], f"Failed to add helm repo (sandboxed) {url}", capture_stdout=False) is None:
+                return None
+        elif not self._helm_indexes_fresh(cache, [name]):
+            if self.run_helm(["repo", "update", name], f"Failed to update helm repo cache (sandboxed) {url}", capture_stdout=False) is None:
+                return None
+        chart_ref = f"{name}/{self.addon_chart}"
+        out = self.run_helm(["search", "repo", chart_ref, "--versions", "--devel", "-o", "json"], f"Failed to search helm repo for {chart_ref}")
+        try:
+            entries = json.loads(out) if out else []
+        except ValueError:
+            return None
+        return _exact_search_versions(entries, chart_ref) or None
+
     def download_chart(self, destination_folder, version=None):
         """
         Downloads and extracts the Helm chart to the specified destination folder.
@@ -658,26 +1335,147 @@ class HelmChart:
                 except Exception as e:
                     logger.warning(f"Unable to remove extracted chart directory {extracted_root}: {e}")
 
+        cached_file = self._chart_cache_path(version)
+        with self._chart_cache_lock(cached_file):
+            if self._restore_cached_chart(cached_file, chart_file):
+                logger.info(f"Using cached chart archive {cached_file}")
+            else:
+                self._pull_chart(chart_dir, version)
+                if not os.path.exists(chart_file):
+                    raise Exception(f"Chart file {chart_file} not found after download")
+                self._store_cached_chart(chart_file, cached_file)
+
+        # Stream mode ('r|gz'): decompress and extract in one forward pass, no seeking back.
+        # The extracted tree is always rebuilt: the values overlay and repack mutate it per run.
+        with tarfile.open(chart_file, 'r|gz', bufsize=_TAR_READ_BUFSIZE) as tar:
+            tar.extractall(path=f"{chart_dir}", **_TAR_EXTRACT_KWARGS)
+
+        return chart_file
+
+    def prefetch_chart(self, pull_latest=False):
+        """
+        Resolve the chart version and make sure its archive is in the chart cache, so the later
+        get_remote_version/download_chart calls need no network. Meant to run concurrently for
+        charts with different names (each has its own helm sandbox). Returns the version, or None
+        if the chart could not be prefetched; the chart is then left as it was for the normal path.
+        """
+        requested_version = self.addon_chart_version
+        failures_mark = len(self.failed_commands)
+        version = self.get_remote_version(pull_latest)
+        cached = False
+        if version:
+            cached_file = self._chart_cache_path(version)
+            with self._chart_cache_lock(cached_file):
+                cached = self._cached_chart_present(cached_file)
+                if not cached:
+                    pull_dir = tempfile.mkdtemp(prefix="airgap-chart-")
+                    try:
+                        self._pull_chart(pull_dir, version)
+                        pulled = os.path.join(pull_dir, f"{self.addon_chart}-{version}.tgz")
+                        if os.path.exists(pulled):
+                            self._store_cached_chart(pulled, cached_file)
+                            cached = self._cached_chart_present(cached_file)
+                    finally:
+                        shutil.rmtree(pull_dir, ignore_errors=True)
+        if not cached:
+            # Undo side effects; the per-chart pipeline resolves, downloads and reports again
+            self.addon_chart_version = requested_version
+            del self.failed_commands[failures_mark:]
+            return None
+        self._prefetched_version = (pull_latest, version)
+        return version
+
+    @staticmethod
+    def _cached_chart_present(cached_file) -> bool:
+        try:
+            return os.path.getsize(cached_file) > 0
+        except OSError:
+            return False
+
+    def _pull_chart(self, chart_dir, version):
+        """
+        Pull the chart archive for version into chart_dir with helm (OCI or classic repo).
+        """
         use_oci = self._is_oci_repository()
         if use_oci:
             # Only login for public ECR
-            if "public.ecr.aws" in (self.addon_chart_repository or ""):
+            if self._is_public_ecr_chart_repository():
                 self._login_ecr_public_chart()
             chart_ref = self._build_oci_chart_ref()
             cmd_pull_chart = ["helm", "pull", chart_ref, "--version", version, "--destination", chart_dir]
             args_pull = cmd_pull_chart[1:]
-            self.run_helm(args_pull, "Failed to pull chart from OCI registry")
+            self.run_helm(args_pull, "Failed to pull chart from OCI registry", capture_stdout=False)
         else:
             cmd_pull_chart = ["helm", "pull", self.addon_chart, "--repo", self.addon_chart_repository, "--version", version, "--destination", chart_dir]
             self.run_command(cmd_pull_chart, "Failed to pull chart")
 
-        if not os.path.exists(chart_file):
-            raise Exception(f"Chart file {chart_file} not found after download")
+    def _chart_cache_path(self, version):
+        """
+        Content-addressed cache location for this chart's archive at version.
+        OCI charts are keyed on the full chart reference (which includes the namespace),
+        classic repositories on repository URL and chart name.
+        """
+        source = self._build_oci_chart_ref() if self._is_oci_repository() else f"{self.addon_chart_repository}|{self.addon_chart}"
+        key = hashlib.sha256(f"{source}|{version}".encode("utf-8")).hexdigest()
+        return os.path.join(_CHART_CACHE_DIR, key, f"{self.addon_chart}-{version}.tgz")
 
-        with tarfile.open(chart_file, 'r:gz') as tar:
-            tar.extractall(path=f"{chart_dir}")
+    @staticmethod
+    @contextlib.contextmanager
+    def _chart_cache_lock(cached_file):
+        """
+        Hold an exclusive lock on the cache entry's '.lock' sidecar so concurrent runs
+        don't download or store the same chart at once. Degrades to no locking if the
+        cache directory is unusable.
+        """
+        lock_fd = None
+        try:
+            os.makedirs(os.path.dirname(cached_file), exist_ok=True)
+            lock_fd = os.open(os.path.join(os.path.dirname(cached_file), ".lock"), os.O_RDWR | os.O_CREAT, 0o600)
+            if fcntl is not None:
+                fcntl.flock(lock_fd, fcntl.LOCK_EX)
+        except OSError as e:
+            logger.warning(f"Chart cache unavailable at {cached_file}: {e}")
+        try:
+            yield
+        finally:
+            if lock_fd is not None:
+                os.close(lock_fd)
 
-        return chart_file
+    @staticmethod
+    def _restore_cached_chart(cached_file, chart_file):
+        """
+        Hardlink (or copy, across filesystems) a cached archive to chart_file. Returns True on a hit.
+        """
+        try:
+            if os.path.getsize(cached_file) == 0:
+                return False
+        except OSError:
+            return False
+        try:
+            os.link(cached_file, chart_file)
+        except OSError:
+            try:
+                shutil.copyfile(cached_file, chart_file)
+            except OSError as e:
+                logger.warning(f"Unable to restore cached chart {cached_file}: {e}")
+                return False
+        return True
+
+    @staticmethod
+    def _store_cached_chart(chart_file, cached_file):
+        """
+        Add a freshly pulled archive to the cache (best effort). The cache entry is
+        published with os.replace so readers never see a partial archive.
+        """
+        tmp = f"{cached_file}.tmp"
+        try:
+            try:
+                os.link(chart_file, tmp)
+            except OSError:
+                shutil.copyfile(chart_file, tmp)
+            os.replace(tmp, cached_file)
+        except OSError as e:
+            logger.warning(f"Unable to cache chart archive {chart_file}: {e}")
 
     # -------------------------
     # Chart mutation helpers (apply overlay and repack)
@@ -783,9 +1581,8 @@ class HelmChart:
             path = "./chart-overrides.yaml"
             if not os.path.exists(path):
                 return None
-            yaml = YAML()
-            with open(path, "r", encoding="utf-8") as f:
-                data = yaml.load(f) or {}
+            with open(path, "rb") as f:
+                data = yaml.load(f, Loader=_YAML_LOADER) or {}
             overrides_root = data.get("overrides") or {}
             chart_vals = overrides_root.get(self.addon_chart)
             return chart_vals if isinstance(chart_vals, dict) else None
@@ -802,7 +1599,7 @@ class HelmChart:
             exclude_dependencies (bool): If True, do not render vendored subcharts (charts/).
         """
         logger.info(f"Getting images for {self.addon_chart} (exclude_dependencies={exclude_dependencies})")
-        renamed_charts_dir = None
+        exclusion_dir = None
         chart_root = os.path.join(os.path.dirname(chart), self.addon_chart)
         template_target = Path(chart_root) if os.path.isdir(chart_root) else Path(chart)
 
@@ -825,30 +1622,40 @@ class HelmChart:
                     logger.warning(f"Unable to materialize external overrides for {self.addon_chart}: {e}")
 
             # Include dependencies: build them if missing and enable conditional deps
-            if not exclude_dependencies and os.path.isdir(chart_root):
+            if not exclude_dependencies and os.path.isdir(chart_root) and self._vendored_dependencies_satisfied(chart_root):
+                logger.info(f"All Chart.lock dependencies already vendored for {self.addon_chart}; skipping dependency build")
+                template_target = Path(chart_root)
+            elif not exclude_dependencies and os.path.isdir(chart_root):
                 # Ensure required helm repos are added for dependencies
                 self._ensure_helm_repos(chart_root)
                 # Build dependencies (vendors subcharts referenced in Chart.yaml)
                 # Pre-login if any dependency is OCI on public.ecr.aws
-                decls_for_login = self._collect_declared_dependencies(chart_root)
-                if any(((d.get("repository") or "").startswith("oci://") and "public.ecr.aws" in (d.get("repository") or "")) for d in decls_for_login):
+                # Collect OCI dependency hosts in one pass over the declared dependencies
+                oci_hosts = []
+                needs_public_ecr_login = False
+                for d in self._collect_declared_dependencies(chart_root):
+                    repo = d.get("repository") or ""
+                    if repo.startswith("oci://"):
+                        oci_hosts.append(repo)
+                        if _repository_host(repo) == _PUBLIC_ECR_HOST:
+                            needs_public_ecr_login = True
+                if needs_public_ecr_login:
                     try:
                         logger.info("Logging into public ECR for OCI dependencies (helm)")
                         self._login_ecr_public_chart()
                     except Exception as e:
                         logger.warning(f"Helm registry login to public ECR for dependencies failed: {e}")
                 # Log any OCI dependency hosts for visibility
-                oci_hosts = [(d.get("repository") or "") for d in decls_for_login if (d.get("repository") or "").startswith("oci://")]
                 if oci_hosts:
                     logger.info(f"Detected OCI dependencies: {', '.join(oci_hosts)}")
                 # Use sandboxed helm with OCI enabled for dependency operations
-                dep_build_out = self.run_helm(["dependency", "build", chart_root], "Failed to build chart dependencies")
+                dep_build_out = self.run_helm(["dependency", "build", chart_root], "Failed to build chart dependencies", capture_stdout=False)
                 if dep_build_out is None:
                     logger.warning("Dependency build failed; attempting 'helm dependency update'")
-                    dep_update_out = self.run_helm(["dependency", "update", chart_root], "Failed to update chart dependencies")
+                    dep_update_out = self.run_helm(["dependency", "update", chart_root], "Failed to update chart dependencies", capture_stdout=False)
                     if dep_update_out is not None:
                         logger.info("Dependency update succeeded; retrying 'helm dependency build'")
-                        dep_build_retry = self.run_helm(["dependency", "build", chart_root], "Failed to build chart dependencies (after update)")
+                        dep_build_retry = self.run_helm(["dependency", "build", chart_root], "Failed to build chart dependencies (after update)", capture_stdout=False)
                         if dep_build_retry is not None:
                             logger.info("Dependency build succeeded after update")
                             # Drop the earlier build failure from summary if present
@@ -865,17 +1672,35 @@ class HelmChart:
 
                 template_target = Path(chart_root)
 
-            # Exclude vendored subcharts by temporarily moving charts/ away
+            # Exclude vendored subcharts by rendering a symlinked view of the chart without charts/
+            # (the extracted chart itself is left untouched)
             if exclude_dependencies and os.path.isdir(chart_root):
+                template_target = Path(chart_root)
                 charts_dir = os.path.join(chart_root, "charts")
                 if os.path.isdir(charts_dir):
-                    renamed_charts_dir = charts_dir + ".skipped"
+                    exclusion_dir = tempfile.mkdtemp(prefix=f"{self.addon_chart}-nodeps-")
+                    entries = [entry for entry in os.listdir(chart_root) if entry != "charts"]
                     try:
-                        os.rename(charts_dir, renamed_charts_dir)
-                        logger.info(f"Temporarily excluding vendored subcharts at {charts_dir}")
-                    except Exception as e:
-                        logger.warning(f"Unable to temporarily exclude subcharts at {charts_dir}: {e}")
-                template_target = Path(chart_root)
+                        for entry in entries:
+                            os.symlink(os.path.abspath(os.path.join(chart_root, entry)), os.path.join(exclusion_dir, entry))
+                    except OSError as e:
+                        # Symlinks unavailable (e.g. Windows without Developer Mode): copy the chart instead
+                        logger.info(f"Unable to symlink chart view ({e}); copying {self.addon_chart} without charts/")
+                        shutil.rmtree(exclusion_dir, ignore_errors=True)
+                        os.makedirs(exclusion_dir, exist_ok=True)
+                        try:
+                            for entry in entries:
+                                src = os.path.join(chart_root, entry)
+                                dst = os.path.join(exclusion_dir, entry)
+                                if os.path.isdir(src):
+                                    shutil.copytree(src, dst)
+                                else:
+                                    shutil.copy2(src, dst)
+                        except OSError as copy_err:
+                            # Never render with charts/ present when exclusion was requested
+                            raise Exception(f"Unable to exclude subcharts at {charts_dir}: {copy_err}")
+                    template_target = Path(exclusion_dir)
+                    logger.info(f"Temporarily excluding vendored subcharts at {charts_dir}")
 
             # Pre-inject minimal overrides for known charts to satisfy required values during template
             # Only apply inline flags if no external overrides are provided
@@ -911,7 +1736,6 @@ class HelmChart:
 
             # Enhanced image extraction: compose fully-qualified refs from common patterns
             images_found = set()
-            ryaml = YAML()
             def _emit(repo: str | None, tag: str | None = None, digest: str | None = None, registry: str | None = None):
                 if not repo or not isinstance(repo, str):
                     return
@@ -954,11 +1778,9 @@ class HelmChart:
                     for it in node:
                         _visit(it)
 
-            try:
-                docs = list(ryaml.load_all(helm_output))
-            except Exception:
-                docs = []
-            for d in docs:
+            # Rendered manifests are only read, so use the libyaml safe loader (no round-trip).
+            # Most documents (RBAC, Services, ...) carry no image keys; a regex scan skips parsing them.
+            for d in _parse_image_documents(helm_output, self.addon_chart):
                 _visit(d)
 
             # Fallback heuristic: simple scrape of image: <value> if parsing yielded nothing
@@ -969,89 +1791,100 @@ class HelmChart:
                         if val and val != "---":
                             images_found.add(val)
 
-            unique_images = {img.split('@')[0] if '@' in img else img for img in images_found if img}
-            # Normalize hosts and dedupe again after normalization
-            normalized_images = list({ self._normalize_image_host(img) for img in unique_images })
-            # Filter out any refs already pointing at private ECR (validate/copy only source refs)
+            # Strip digests, normalize hosts, dedupe and drop refs already pointing at private ECR
+            # (validate/copy only source refs) in a single pass
+            priv_prefix = f"{self.private_ecr_url}/" if self.private_ecr_url else None
+            seen = set()
+            normalized_images = []
             skipped_private = []
-            if self.private_ecr_url:
-                priv_prefix = f"{self.private_ecr_url}/"
-                filtered_images = []
-                for img in normalized_images:
-                    if img.startswith(priv_prefix):
-                        skipped_private.append(img)
-                    else:
-                        filtered_images.append(img)
-                if skipped_private:
-                    logger.info(f"Skipping {len(skipped_private)} private refs from validation: {skipped_private[:3]}{'...' if len(skipped_private)>3 else ''}")
-                normalized_images = filtered_images
-
-            # Authenticate to Docker Hub up-front if any Docker Hub images are present and creds provided
-            if any(self._is_dockerhub_image(img) for img in normalized_images) and getattr(self, "dockerhub_username", "") and getattr(self, "dockerhub_token", ""):
-                try:
-                    self._crane_login_dockerhub()
-                except Exception as e:
-                    logger.warning(f"Docker Hub authentication attempt failed; will continue unauthenticated. Details: {e}")
-            # Always authenticate to public ECR up-front if any public ECR images are present
-            if any("public.ecr.aws" in img for img in normalized_images):
-                logger.info("Public ECR images detected; authenticating to public ECR (crane)")
-                try:
-                    self.authenticate_ecr(is_public=True)
-                except Exception as e:
-                    logger.warning(f"Public ECR authentication attempt failed; will continue with retries. Details: {e}")
-
-            # Validate images exist by fetching their manifests via crane (daemonless)
-            for image in normalized_images:
-                out = self.run_crane(["manifest", image], f"Crane manifest inspect failed for {image}")
+            for img in sorted(images_found):
+                if not img:
+                    continue
+                key = self._normalize_image_host(img.split('@', 1)[0])
+                if key in seen:
+                    continue
+                seen.add(key)
+                if priv_prefix and key.startswith(priv_prefix):
+                    skipped_private.append(key)
+                else:
+                    normalized_images.append(key)
+            if skipped_private:
+                logger.info(f"Skipping {len(skipped_private)} private refs from validation: {skipped_private[:3]}{'...' if len(skipped_private)>3 else ''}")
+
+            # Authenticate to public ECR / Docker Hub up-front for the registries these images use
+            self._authenticate_image_sources(normalized_images)
+
+            # Validate images exist by fetching their manifests via crane (daemonless), concurrently;
+            # logins happened above so workers only issue registry reads
+            def _inspect(image):
+                return self._crane_manifest(image, f"Crane manifest inspect failed for {image}")
+
+            manifests = []
+            if normalized_images:
+                with ThreadPoolExecutor(max_workers=min(len(normalized_images), _MAX_MANIFEST_WORKERS)) as pool:
+                    manifests = list(pool.map(_inspect, normalized_images))
+            for image, out in zip(normalized_images, manifests):
                 if out is not None:
                     self.public_addon_chart_images.append(image)
                 else:
-                    logger.warning(f"Skipping image {image} due to failure in manifest inspection")
-                    self.failed_pull_addon_chart_images.append(image)
-            logger.info(f"Extracted images: {self.public_addon_chart_images}")
+                    logger.warning("Skipping image %s due to failure in manifest inspection", image)
+                    self.failed_pull_addon_chart_images.add(image)
+            logger.info("Extracted images: %s", self.public_addon_chart_images)
         finally:
-            # Restore vendored subcharts directory if it was renamed
-            if renamed_charts_dir and os.path.exists(renamed_charts_dir):
-                try:
-                    os.rename(renamed_charts_dir, os.path.join(chart_root, "charts"))
-                except Exception as e:
-                    logger.warning(f"Unable to restore vendored subcharts: {e}")
+            # Drop the symlinked view used to exclude vendored subcharts
+            if exclusion_dir:
+                shutil.rmtree(exclusion_dir, ignore_errors=True)
+
+    def _validate_image(self, image: str, retry_count: int, retry_delay: float) -> bool:
+        """
+        Check that a single image manifest is reachable, retrying with jittered exponential backoff
+        (retry_delay is the base delay).
+        Registry logins must already be done (see pulling_chart_images). Safe to run from a worker thread.
+        """
+        for attempt in range(retry_count):
+            errors = []
+            try:
+                if self._crane_manifest(image, f"Crane manifest check failed for {image}", errors=errors) is not None:
+                    return True
+                raise RuntimeError(f"Manifest check failed for {image}")
+            except Exception as e:
+                logger.error("Attempt %s failed to validate image %s: %s", attempt + 1, image, e)
+                if errors and _is_permanent_error(errors[-1]):
+                    logger.error("Image %s cannot be validated (not retrying): %s", image, errors[-1].strip())
+                    break
+                if attempt + 1 < retry_count:
+                    delay = _backoff_delay(attempt, retry_delay)
+                    logger.info("Retrying in %.1f seconds...", delay)
+                    time.sleep(delay)
+                else:
+                    logger.error("Maximum attempts reached for validating image %s.", image)
+        return False
 
-    def pulling_chart_images(self, retry_count=3, retry_delay=5):
+    def pulling_chart_images(self, retry_count=3, retry_delay=1.0):
         """
         No-op pull in daemonless mode. We validate reachability via crane manifest with retries.
+        Images are checked concurrently; registry logins happen once up-front.
         """
-        logger.info(f"Validating availability of images (daemonless) for chart {self.addon_chart}")
+        logger.info("Validating availability of images (daemonless) for chart %s", self.addon_chart)
         images_to_check = list(self.public_addon_chart_images)
         if self.private_ecr_url:
             priv_prefix = f"{self.private_ecr_url}/"
             images_to_check = [i for i in images_to_check if not i.startswith(priv_prefix)]
             skipped = len(self.public_addon_chart_images) - len(images_to_check)
             if skipped > 0:
-                logger.info(f"Skipping {skipped} private refs during validation (will be created by copy).")
-        for image in images_to_check:
-            image = self._normalize_image_host(image)
-            for attempt in range(retry_count):
-                try:
-                    # Attempt auth for public ECR and optional Docker Hub as needed
-                    if self._is_dockerhub_image(image) and getattr(self, "dockerhub_username", "") and getattr(self, "dockerhub_token", ""):
-                        self._crane_login_dockerhub()
-                    if "public.ecr.aws" in image:
-                        self.authenticate_ecr(is_public=True)
-                    # Validate manifest
-                    ok = self.run_crane(["manifest", image], f"Crane manifest check failed for {image}") is not None
-                    if ok:
-                        break
-                    else:
-                        raise RuntimeError(f"Manifest check failed for {image}")
-                except Exception as e:
-                    logger.error(f"Attempt {attempt + 1} failed to validate image {image}: {e}")
-                    if attempt + 1 < retry_count:
-                        logger.info(f"Retrying in {retry_delay} seconds...")
-                        time.sleep(retry_delay)
-                    else:
-                        logger.error(f"Maximum attempts reached for validating image {image}.")
-                        self.failed_pull_addon_chart_images.append(image)
+                logger.info("Skipping %s private refs during validation (will be created by copy).", skipped)
+        images_to_check = [self._normalize_image_host(i) for i in images_to_check]
+        if not images_to_check:
+            return
+
+        # Authenticate source registries once, before workers start
+        self._authenticate_image_sources(images_to_check)
+
+        with ThreadPoolExecutor(max_workers=min(len(images_to_check), _MAX_MANIFEST_WORKERS)) as pool:
+            results = list(pool.map(lambda img: self._validate_image(img, retry_count, retry_delay), images_to_check))
+        for image, ok in zip(images_to_check, results):
+            if not ok:
+                self.failed_pull_addon_chart_images.add(image)
 
     # -------------------------
     # Image push (crane cp)
@@ -1062,12 +1895,8 @@ class HelmChart:
         Resolve a child manifest digest for the desired platform from a multi-arch index.
         Returns a digest string like 'sha256:abcd...' or None if not found/single-arch.
         """
-        out = self.run_crane(["manifest", image], f"Crane manifest fetch failed for {image}")
-        if out is None:
-            return None
-        try:
-            manifest = json.loads(out)
-        except Exception:
+        manifest = self._crane_manifest(image)
+        if not manifest:
             return None
         media_type = (manifest.get("mediaType") or "").lower()
         # Normalize platform components
@@ -1139,243 +1968,580 @@ class HelmChart:
             self.get_private_ecr_url()
         private_refs: list[str] = []
         for public_repo in self.public_addon_chart_images:
-            _, src_repo_path, src_tag, src_digest = self._parse_image_ref(public_repo)
-            dest_repo_path = f"{self.repository_prefix}/{src_repo_path}" if getattr(self, "repository_prefix", "") else src_repo_path
-            # Determine tag
-            image_tag = src_tag
-            if not image_tag:
-                if src_digest and src_digest.startswith("sha256:"):
-                    image_tag = f"sha-{src_digest[7:19]}"
-                else:
-                    image_tag = "latest"
+            dest_repo_path, image_tag = self._private_target(public_repo)
             private_refs.append(f"{self.private_ecr_url}/{dest_repo_path}:{image_tag}")
         return private_refs
 
-    def push_images_to_ecr(self, retry_count=3, retry_delay=5):
+    def _private_target(self, public_repo: str) -> tuple[str, str]:
         """
-        Copies container images to the private ECR repository using crane (daemonless).
-        Applies skip/verify/overwrite logic based on existing tags in ECR (sequential; no concurrency).
-        """
-        def _crane_digest(ref: str) -> str | None:
-            """
-            Return the digest (sha256:...) for a reference using crane digest.
-            """
-            out = self.run_crane(["digest", ref], f"Failed to get digest for {ref}")
-            dig = (out or "").strip() if out is not None else ""
-            return dig if dig.startswith("sha256:") else None
-
-        def _ecr_tag_digest(repo: str, tag: str) -> str | None:
-            """
-            Return the digest for an existing ECR tag, or None if tag not found.
-            """
+        Return (destination repo path, destination tag) for a public image reference.
+        Mirror source layout: the repo path mirrors the source path (host swap + optional prefix).
+        """
+        _, src_repo_path, src_tag, src_digest = self._parse_image_ref(public_repo)
+        dest_repo_path = f"{self.repository_prefix}/{src_repo_path}" if getattr(self, "repository_prefix", "") else src_repo_path
+        # Determine tag
+        image_tag = src_tag
+        if not image_tag:
+            if src_digest and src_digest.startswith("sha256:"):
+                image_tag = f"sha-{src_digest[7:19]}"
+            else:
+                image_tag = "latest"
+        return dest_repo_path, image_tag
+
+    def _known_ecr_repositories(self) -> set:
+        """
+        Return the names of all private ECR repositories, listed once per process with the
+        describe_repositories paginator and shared by every HelmChart instance.
+        Raises ClientError/BotoCoreError if the listing fails (nothing is cached then).
+        """
+        cls = type(self)
+        if cls._ecr_repository_names is None:
+            paginator = self.ecr_client.get_paginator("describe_repositories")
+            names = paginator.paginate().search("repositories[].repositoryName")
+            cls._ecr_repository_names = {name for name in names if name}
+        return cls._ecr_repository_names
+
+    def _ensure_ecr_repositories(self, repo_names) -> None:
+        """
+        Make sure every repository in repo_names exists in private ECR.
+        Checks the process-wide repository listing and creates only the missing ones, concurrently.
+        """
+        needed = {name for name in repo_names if name}
+        if not needed:
+            return
+        try:
+            existing = self._known_ecr_repositories()
+        except (ClientError, BotoCoreError) as e:
+            logger.error("Error describing ECR repositories: %s", e)
+            return
+        for name in sorted(needed & existing):
+            logger.info("ECR repository %s exists.", name)
+        missing = sorted(needed - existing)
+        if not missing:
+            return
+
+        def _create(name):
+            logger.info("Repository %s not found, creating new repository...", name)
             try:
-                resp = self.ecr_client.describe_images(
-                    repositoryName=repo,
-                    imageIds=[{"imageTag": tag}]
-                )
-                details = resp.get("imageDetails") or []
-                if details:
-                    dig = details[0].get("imageDigest") or ""
-                    return dig if dig.startswith("sha256:") else None
+                self.ecr_client.create_repository(repositoryName=name, tags=[{"Key": "chart-syncer", "Value": "true"}])
+                self._new_ecr_repos.add(name)
+                self._wait_for_ecr_repository(name)
+                existing.add(name)
             except ClientError as e:
-                # Image (tag) not found
-                if e.response.get("Error", {}).get("Code") in ("ImageNotFoundException", "RepositoryNotFoundException"):
-                    return None
-                logger.warning(f"ECR describe_images failed for {repo}:{tag}: {e}")
-            return None
+                # Created meanwhile by another run; nothing to do
+                if e.response["Error"]["Code"] == "RepositoryAlreadyExistsException":
+                    existing.add(name)
+                else:
+                    logger.error("Unable to create ECR repository: %s", e)
+            except BotoCoreError as e:
+                logger.error("Unable to create ECR repository %s: %s", name, e)
 
-        def _delete_ecr_tag(repo: str, tag: str) -> None:
-            """
-            Delete a tag from ECR (best effort).
-            """
+        with ThreadPoolExecutor(max_workers=min(len(missing), _MAX_ECR_API_WORKERS)) as pool:
+            list(pool.map(_create, missing))
+
+    @classmethod
+    def prefetch_existing_tags(cls, ecr_client, repo_names) -> None:
+        """
+        List the tags of each private ECR repository once (paginated list_images, repositories
+        in parallel) and record them in _EXISTING_TAGS, so push_chart_to_ecr can tell whether a
+        chart version is already published without a describe call per chart.
+        Repositories that do not exist are left out and handled by the per-chart path.
+        """
+        names = sorted({name for name in repo_names if name} - set(_EXISTING_TAGS))
+        if not names:
+            return
+        if ecr_client is None:
+            ecr_client = cls._shared_client("ecr", cls._shared_session().region_name)
+
+        def _list(name):
+            tags = set()
+            try:
+                paginator = ecr_client.get_paginator("list_images")
+                for page in paginator.paginate(repositoryName=name, filter={"tagStatus": "TAGGED"}):
+                    tags.update(i["imageTag"] for i in page.get("imageIds", []) if i.get("imageTag"))
+            except ClientError as e:
+                if e.response["Error"]["Code"] != "RepositoryNotFoundException":
+                    logger.warning("Unable to list existing tags for ECR repository %s: %s", name, e)
+                return name, None
+            except BotoCoreError as e:
+                # Unknown: push_chart_to_ecr checks this repository itself
+                logger.warning("Unable to list existing tags for ECR repository %s: %s", name, e)
+                return name, None
+            return name, tags
+
+        with ThreadPoolExecutor(max_workers=min(len(names), _MAX_ECR_API_WORKERS)) as pool:
+            for name, tags in pool.map(_list, names):
+                if tags is not None:
+                    _EXISTING_TAGS[name] = tags
+
+    def _wait_for_ecr_repository(self, name: str, attempts: int = 5) -> bool:
+        """
+        Wait until a just-created repository is visible to describe_repositories, so the first
+        push does not race ECR's eventual consistency. Returns on the first successful describe
+        (the usual case, no sleep); otherwise polls with short jittered backoff.
+        """
+        for attempt in range(attempts):
+            try:
+                self.ecr_client.describe_repositories(repositoryNames=[name])
+                return True
+            except ClientError as e:
+                if e.response["Error"]["Code"] != "RepositoryNotFoundException":
+                    logger.warning("Unable to confirm ECR repository %s: %s", name, e)
+                    return False
+            except BotoCoreError as e:
+                logger.warning("Unable to confirm ECR repository %s: %s", name, e)
+                return False
+            if attempt + 1 < attempts:
+                time.sleep(_backoff_delay(attempt, 0.25, 2.0))
+        logger.warning("ECR repository %s not visible after creation; continuing anyway", name)
+        return False
+
+    def _crane_digest(self, ref: str) -> str | None:
+        """
+        Return the digest (sha256:...) for a reference using crane digest.
+        Results are cached per reference for the lifetime of this chart.
+        """
+        if ref in self._src_digest_cache:
+            return self._src_digest_cache[ref]
+        out = self.run_crane(["digest", ref], f"Failed to get digest for {ref}")
+        dig = (out or "").strip() if out is not None else ""
+        dig = dig if dig.startswith("sha256:") else None
+        if dig:
+            self._src_digest_cache[ref] = dig
+        return dig
+
+    def _prefetch_ecr_tag_digests(self, targets) -> None:
+        """
+        Look up existing private ECR tags for (repo, tag) targets with batch_get_image,
+        up to 100 tags per call and one call per repository in parallel.
+        Results land in self._ecr_tag_digests for _ecr_tag_digest to consume.
+        """
+        by_repo = {}
+        for repo, tag in targets:
+            if not repo or not tag or (repo, tag) in self._ecr_tag_digests:
+                continue
+            if repo in self._new_ecr_repos:
+                # Created by this run, so no tags to find
+                self._ecr_tag_digests[(repo, tag)] = None
+            else:
+                by_repo.setdefault(repo, set()).add(tag)
+        batches = []
+        for repo, tags in by_repo.items():
+            tags = sorted(tags)
+            for i in range(0, len(tags), _ECR_BATCH_GET_LIMIT):
+                batches.append((repo, tags[i:i + _ECR_BATCH_GET_LIMIT]))
+        if not batches:
+            return
+
+        def _lookup(batch):
+            repo, tags = batch
+            found = dict.fromkeys(tags)
             try:
-                self.ecr_client.batch_delete_image(
+                resp = self.ecr_client.batch_get_image(
                     repositoryName=repo,
-                    imageIds=[{"imageTag": tag}]
+                    imageIds=[{"imageTag": t} for t in tags],
+                    acceptedMediaTypes=_ECR_MANIFEST_MEDIA_TYPES,
                 )
-                logger.info(f"Deleted existing ECR tag {repo}:{tag} before overwrite")
             except ClientError as e:
-                logger.warning(f"Unable to delete ECR tag {repo}:{tag}: {e}")
+                if e.response["Error"]["Code"] == "RepositoryNotFoundException":
+                    return repo, found
+                # Leave these tags to the per-image describe_images fallback
+                logger.warning("ECR batch_get_image failed for %s: %s", repo, e)
+                return repo, {}
+            except BotoCoreError as e:
+                logger.warning("ECR batch_get_image failed for %s: %s", repo, e)
+                return repo, {}
+            for image in resp.get("images") or []:
+                image_id = image.get("imageId") or {}
+                dig = image_id.get("imageDigest") or ""
+                if image_id.get("imageTag") in found and dig.startswith("sha256:"):
+                    found[image_id["imageTag"]] = dig
+            return repo, found
+
+        with ThreadPoolExecutor(max_workers=min(len(batches), _MAX_ECR_API_WORKERS)) as pool:
+            for repo, found in pool.map(_lookup, batches):
+                for tag, dig in found.items():
+                    self._ecr_tag_digests[(repo, tag)] = dig
+
+    def _ecr_tag_digest(self, repo: str, tag: str, refresh: bool = False) -> str | None:
+        """
+        Return the digest for an existing ECR tag, or None if tag not found.
+        Uses the batch-prefetched result when there is one, unless refresh is set.
+        """
+        if not refresh and (repo, tag) in self._ecr_tag_digests:
+            return self._ecr_tag_digests[(repo, tag)]
+        try:
+            resp = self.ecr_client.describe_images(
+                repositoryName=repo,
+                imageIds=[{"imageTag": tag}]
+            )
+            details = resp.get("imageDetails") or []
+            if details:
+                dig = details[0].get("imageDigest") or ""
+                return dig if dig.startswith("sha256:") else None
+        except ClientError as e:
+            # Image (tag) not found
+            if e.response.get("Error", {}).get("Code") in ("ImageNotFoundException", "RepositoryNotFoundException"):
+                return None
+            logger.warning("ECR describe_images failed for %s:%s: %s", repo, tag, e)
+        except BotoCoreError as e:
+            logger.warning("ECR describe_images failed for %s:%s: %s", repo, tag, e)
+        return None
 
-        for public_repo in self.public_addon_chart_images:
-            # Mirror source layout: destination repo mirrors source repo path (host swap + optional prefix)
-            _, src_repo_path, src_tag, src_digest = self._parse_image_ref(public_repo)
-            dest_repo_path = f"{self.repository_prefix}/{src_repo_path}" if getattr(self, "repository_prefix", "") else src_repo_path
-            # Determine destination tag
-            image_tag = src_tag
-            if not image_tag:
-                if src_digest and src_digest.startswith("sha256:"):
-                    image_tag = f"sha-{src_digest[7:19]}"
+    def _tag_existing_ecr_digest(self, repo: str, digest: str, tag: str) -> bool:
+        """
+        If repo already stores digest, point tag at it with put_image (no layer transfer).
+        Returns True when the tag now references digest.
+        The shortcut is turned off for the rest of the run after the first AccessDenied
+        (push-only policies may lack ecr:BatchGetImage), and crane copies are used instead.
+        """
+        if HelmChart._ecr_retag_denied:
+            return False
+        try:
+            resp = self.ecr_client.batch_get_image(
+                repositoryName=repo,
+                imageIds=[{"imageDigest": digest}],
+                acceptedMediaTypes=_ECR_MANIFEST_MEDIA_TYPES,
+            )
+        except ClientError as e:
+            code = e.response["Error"]["Code"]
+            if code == "AccessDeniedException":
+                self._disable_ecr_retag("batch_get_image", e)
+            elif code != "RepositoryNotFoundException":
+                logger.warning("ECR batch_get_image failed for %s@%s: %s", repo, digest, e)
+            return False
+        except BotoCoreError as e:
+            logger.warning("ECR batch_get_image failed for %s@%s: %s", repo, digest, e)
+            return False
+        images = resp.get("images") or []
+        if not images or not images[0].get("imageManifest"):
+            return False
+        put_args = {
+            "repositoryName": repo,
+            "imageManifest": images[0]["imageManifest"],
+            "imageTag": tag,
+            "imageDigest": digest,
+        }
+        if images[0].get("imageManifestMediaType"):
+            put_args["imageManifestMediaType"] = images[0]["imageManifestMediaType"]
+        try:
+            self.ecr_client.put_image(**put_args)
+        except ClientError as e:
+            # Tag already points at this digest
+            if e.response["Error"]["Code"] == "ImageAlreadyExistsException":
+                return True
+            if e.response["Error"]["Code"] == "AccessDeniedException":
+                self._disable_ecr_retag("put_image", e)
+                return False
+            logger.warning("Unable to tag %s@%s as %s: %s", repo, digest, tag, e)
+            return False
+        except BotoCoreError as e:
+            logger.warning("Unable to tag %s@%s as %s: %s", repo, digest, tag, e)
+            return False
+        return True
+
+    @classmethod
+    def _disable_ecr_retag(cls, operation: str, error) -> None:
+        """
+        Turn off the ECR retag shortcut for the rest of the run, warning only once.
+        """
+        if not cls._ecr_retag_denied:
+            cls._ecr_retag_denied = True
+            logger.warning("ECR %s denied (%s); copying images with crane instead of retagging existing digests for the rest of the run", operation, error)
+
+    def _delete_ecr_tag(self, repo: str, tag: str) -> None:
+        """
+        Delete a tag from ECR (best effort).
+        """
+        try:
+            self.ecr_client.batch_delete_image(
+                repositoryName=repo,
+                imageIds=[{"imageTag": tag}]
+            )
+            logger.info("Deleted existing ECR tag %s:%s before overwrite", repo, tag)
+        except (ClientError, BotoCoreError) as e:
+            logger.warning("Unable to delete ECR tag %s:%s: %s", repo, tag, e)
+
+    def _copy_image_to_ecr(self, public_repo: str, retry_count: int, retry_delay: float) -> tuple[str, bool]:
+        """
+        Copy a single image to private ECR (skip/verify/overwrite, crane cp with backoff retries).
+        The destination repository must already exist (see _ensure_ecr_repositories).
+        Safe to run from a worker thread. Returns (private_image, succeeded).
+        """
+        dest_repo_path, image_tag = self._private_target(public_repo)
+        private_image = f"{self.private_ecr_url}/{dest_repo_path}:{image_tag}"
+        src_digest = None
+
+        # Compose source reference depending on platform preference
+        pref = getattr(self, "platform", "auto")
+        src_ref = public_repo
+        if pref != "auto":
+            plat_digest = self._resolve_platform_digest(public_repo, pref)
+            if plat_digest:
+                # Use digest-based source to force single-arch copy
+                base = public_repo.split("@", 1)[0]
+                src_ref = f"{base}@{plat_digest}"
+                src_digest = plat_digest
+                logger.info("Resolved %s -> %s for platform %s", public_repo, src_ref, pref)
+            else:
+                logger.info("No platform-specific digest found for %s; attempting direct copy", public_repo)
+
+        # Derive destination repo and tag
+        repo_no_tag = dest_repo_path
+        # image_tag already computed above
+
+        # Skip/verify/overwrite logic (tag-based)
+        if image_tag and getattr(self, "skip_existing", True):
+            dst_digest = self._ecr_tag_digest(repo_no_tag, image_tag)
+            if dst_digest:
+                if not getattr(self, "verify_existing_digest", False):
+                    logger.info("Skipping existing tag (no verify): %s:%s", repo_no_tag, image_tag)
+                    return private_image, True
+                # verify_existing_digest = True; resolve the source digest only now that it is needed
+                if not src_digest:
+                    src_digest = self._crane_digest(src_ref)
+                if src_digest and dst_digest == src_digest:
+                    logger.info("Skipping existing tag with matching digest: %s:%s (%s)", repo_no_tag, image_tag, dst_digest)
+                    return private_image, True
+                if getattr(self, "overwrite_existing", False):
+                    logger.info("Overwriting mismatched tag %s:%s (dst=%s, src=%s)", repo_no_tag, image_tag, dst_digest, src_digest or "unknown")
+                    self._delete_ecr_tag(repo_no_tag, image_tag)
                 else:
-                    image_tag = "latest"
-            private_image = f"{self.private_ecr_url}/{dest_repo_path}:{image_tag}"
-            self.private_addon_chart_images.append(private_image)
+                    logger.warning("Digest mismatch for existing tag; skipping (set --overwrite-existing to replace): %s:%s", repo_no_tag, image_tag)
+                    return private_image, True
 
-            # Ensure destination ECR repository exists
+        # Content already stored in the repository under another tag: add this tag, skip the copy
+        if image_tag and getattr(self, "skip_existing", True) and repo_no_tag not in self._new_ecr_repos:
+            if not src_digest:
+                src_digest = self._crane_digest(src_ref)
+            if src_digest and self._tag_existing_ecr_digest(repo_no_tag, src_digest, image_tag):
+                logger.info("Image %s already present in %s; tagged %s without copying", src_digest, repo_no_tag, image_tag)
+                return private_image, True
+
+        # Copy
+        logger.info("Copying image via crane: %s -> %s", src_ref, private_image)
+        deadline = time.monotonic() + _PUSH_DEADLINE_SECONDS
+        destination_retried = False
+        for attempt in range(retry_count):
+            errors = []
             try:
-                ecr_repo = dest_repo_path
-                self.ecr_client.describe_repositories(repositoryNames=[ecr_repo])
-                logger.info(f"ECR repository {ecr_repo} exists.")
-            except ClientError as e:
-                if e.response['Error']['Code'] == 'RepositoryNotFoundException':
-                    logger.info(f"Repository {ecr_repo} not found, creating new repository...")
-                    try:
-                        self.ecr_client.create_repository(repositoryName=ecr_repo, tags=[{"Key": "chart-syncer", "Value": "true"}])
-                    except ClientError as create_err:
-                        logger.error(f"Unable to create ECR repository: {create_err}")
+                result = self.run_crane(["cp", src_ref, private_image], f"Failed to copy image {src_ref} to {private_image}", errors=errors)
+                if result is not None:
+                    logger.info("Successfully copied %s to %s.", public_repo, private_image)
+                    return private_image, True
+                logger.warning("Attempt %s failed to copy %s -> %s", attempt + 1, src_ref, private_image)
+                if errors and _is_permanent_error(errors[-1]):
+                    # Auth/name errors from a source registry are final; at the private ECR destination
+                    # they can mean an expired token or a just-created repository, so retry once
+                    if destination_retried or not self._is_private_ecr_error(errors[-1]):
+                        logger.error("Copy of %s cannot succeed on retry; giving up: %s", src_ref, errors[-1].strip())
+                        break
+                    destination_retried = True
+                    logger.warning("Private ECR rejected %s; refreshing credentials and retrying once: %s", private_image, errors[-1].strip())
+                    self._recover_private_ecr_destination(repo_no_tag)
+                # The copy may have landed despite the error (e.g. connection dropped after the
+                # manifest PUT, or a concurrent run pushed it); don't re-upload identical content
+                if image_tag:
+                    if not src_digest:
+                        src_digest = self._crane_digest(src_ref)
+                    if src_digest and self._ecr_tag_digest(repo_no_tag, image_tag, refresh=True) == src_digest:
+                        logger.info("Destination %s already holds %s; skipping identical copy", private_image, src_digest)
+                        return private_image, True
+                remaining = deadline - time.monotonic()
+                if attempt + 1 < retry_count and remaining <= 0:
+                    logger.error("Retry deadline (%.0fs) exceeded for copying image %s to %s.", _PUSH_DEADLINE_SECONDS, src_ref, private_image)
+                    break
+                if attempt + 1 < retry_count and not _RETRY_BUCKET.try_acquire(_RETRY_COST):
+                    logger.error("Retry budget exhausted (too many failing registry operations); giving up on %s.", src_ref)
+                    break
+                if attempt + 1 < retry_count:
+                    delay = min(_backoff_delay(attempt, retry_delay), remaining)
+                    logger.info("Retrying in %.1f seconds...", delay)
+                    time.sleep(delay)
                 else:
-                    logger.error(f"Error describing ECR repositories: {e}")
+                    logger.error("Maximum attempts reached for copying image %s to %s.", src_ref, private_image)
+            except Exception as e:
+                logger.error("Unexpected error occurred while copying image %s to %s: %s", src_ref, private_image, e)
+                break
+        return private_image, False
 
-            # Ensure auth to destination ECR
-            self.authenticate_ecr(is_public=False)
+    def push_images_to_ecr(self, retry_count=3, retry_delay=1.0):
+        """
+        Copies container images to the private ECR repository using crane (daemonless).
+        Applies skip/verify/overwrite logic based on existing tags in ECR.
+        Images are copied concurrently by a bounded worker pool; registry logins happen once up-front.
+        """
+        images = list(self.public_addon_chart_images)
+        if not images:
+            return
 
-            # Source-side auth if needed
-            if "public.ecr.aws" in public_repo:
-                try:
-                    self.authenticate_ecr(is_public=True)
-                except Exception:
-                    pass
-            elif self._is_dockerhub_image(public_repo) and getattr(self, "dockerhub_username", "") and getattr(self, "dockerhub_token", ""):
-                try:
-                    self._crane_login_dockerhub()
-                except Exception:
-                    pass
-
-            # Compose source reference depending on platform preference
-            pref = getattr(self, "platform", "auto")
-            src_ref = public_repo
-            src_digest = None
-            if pref != "auto":
-                plat_digest = self._resolve_platform_digest(public_repo, pref)
-                if plat_digest:
-                    # Use digest-based source to force single-arch copy
-                    base = public_repo.split("@", 1)[0]
-                    src_ref = f"{base}@{plat_digest}"
-                    src_digest = plat_digest
-                    logger.info(f"Resolved {public_repo} -> {src_ref} for platform {pref}")
-                else:
-                    logger.info(f"No platform-specific digest found for {public_repo}; attempting direct copy")
-            # If not already resolved, get digest (index or single-arch) for skip/verify checks
-            if not src_digest:
-                src_digest = _crane_digest(src_ref)
-
-            # Derive destination repo and tag
-            repo_no_tag = dest_repo_path
-            # image_tag already computed above
-
-            # Skip/verify/overwrite logic (tag-based)
-            if image_tag and getattr(self, "skip_existing", True):
-                dst_digest = _ecr_tag_digest(repo_no_tag, image_tag)
-                if dst_digest:
-                    if not getattr(self, "verify_existing_digest", False):
-                        logger.info(f"Skipping existing tag (no verify): {repo_no_tag}:{image_tag}")
-                        continue
-                    # verify_existing_digest = True
-                    if src_digest and dst_digest == src_digest:
-                        logger.info(f"Skipping existing tag with matching digest: {repo_no_tag}:{image_tag} ({dst_digest})")
-                        continue
-                    if getattr(self, "overwrite_existing", False):
-                        logger.info(f"Overwriting mismatched tag {repo_no_tag}:{image_tag} (dst={dst_digest}, src={src_digest or 'unknown'})")
-                        _delete_ecr_tag(repo_no_tag, image_tag)
-                    else:
-                        logger.warning(f"Digest mismatch for existing tag; skipping (set --overwrite-existing to replace): {repo_no_tag}:{image_tag}")
-                        continue
+        # Create missing destination repositories up-front (one listing, then only the diff)
+        targets = [self._private_target(img) for img in images]
+        self._ensure_ecr_repositories(repo for repo, _ in targets)
+        # Resolve existing destination tags in batches instead of one describe_images per image
+        if getattr(self, "skip_existing", True):
+            self._prefetch_ecr_tag_digests(targets)
 
-            # Copy
-            logger.info(f"Copying image via crane: {src_ref} -> {private_image}")
-            for attempt in range(retry_count):
-                try:
-                    result = self.run_crane(["cp", src_ref, private_image], f"Failed to copy image {src_ref} to {private_image}")
-                    if result is not None:
-                        logger.info(f"Successfully copied {public_repo} to {private_image}.")
-                        break
-                    else:
-                        logger.warning(f"Attempt {attempt + 1} failed to copy {src_ref} -> {private_image}")
-                        if attempt + 1 < retry_count:
-                            logger.info(f"Retrying in {retry_delay} seconds...")
-                            time.sleep(retry_delay)
-                        else:
-                            logger.error(f"Maximum attempts reached for copying image {src_ref} to {private_image}.")
-                            self.failed_push_addon_chart_images.append(private_image)
-                except Exception as e:
-                    logger.error(f"Unexpected error occurred while copying image {src_ref} to {private_image}: {e}")
-                    self.failed_push_addon_chart_images.append(private_image)
-                    break
+        # Authenticate destination and source registries once, before workers start
+        self.authenticate_ecr(is_public=False)
+        self._authenticate_image_sources(images)
+
+        max_workers = min(len(images), _MAX_COPY_WORKERS)
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            results = list(pool.map(lambda img: self._copy_image_to_ecr(img, retry_count, retry_delay), images))
+
+        # Record results in source order so private refs line up with public refs
+        for private_image, ok in results:
+            self.private_addon_chart_images.append(private_image)
+            if not ok:
+                self.failed_push_addon_chart_images.add(private_image)
 
     # -------------------------
     # Chart push (helm OCI)
     # -------------------------
 
-    def push_chart_to_ecr(self, chart_file, retry_count=5, retry_delay=10):
+    def _chart_tag_in_ecr(self, repo_path: str):
         """
-        Pushes the Helm chart to the private ECR repository with retry logic.
+        One describe_images call answering both "repo exists?" and "version published?".
+        Returns True if the chart version tag exists, False if the repository exists without it,
+        and None if the repository does not exist. Other errors raise.
         """
-        ns = (self.addon_chart_repository_namespace or "").strip("/")
-        repo_path = f"{ns}/{self.addon_chart}" if ns else self.addon_chart
         try:
-            self.ecr_client.describe_repositories(repositoryNames=[repo_path])
-            logger.info(f"ECR repository {self.private_ecr_url}/{repo_path} exists.")
+            self.ecr_client.describe_images(repositoryName=repo_path, imageIds=[{"imageTag": self.addon_chart_version}])
+            return True
         except ClientError as e:
-            if e.response["Error"]["Code"] == "RepositoryNotFoundException":
-                logger.info(f"Repository {self.private_ecr_url}/{repo_path} not found, creating new repository...")
+            code = e.response["Error"]["Code"]
+            if code == "RepositoryNotFoundException":
+                return None
+            if code == "ImageNotFoundException":
+                return False
+            logger.error("Error checking existing chart image: %s", e)
+            raise Exception(f"Error checking existing chart image: {e}")
+        except BotoCoreError as e:
+            logger.error("Error checking existing chart image: %s", e)
+            raise Exception(f"Error checking existing chart image: {e}")
+
+    def push_chart_to_ecr(self, chart_file, retry_count=5, retry_delay=1.0):
+        """
+        Pushes the Helm chart to the private ECR repository with retry logic
+        (jittered exponential backoff; retry_delay is the base delay), bounded by
+        retry_count attempts and the _PUSH_DEADLINE_SECONDS wall-clock budget.
+        """
+        ns = (self.addon_chart_repository_namespace or "").strip("/")
+        repo_path = f"{ns}/{self.addon_chart}" if ns else self.addon_chart
+        existing_tags = _EXISTING_TAGS.get(repo_path)
+        if existing_tags is not None:
+            # Repository listed up-front by prefetch_existing_tags, so it exists
+            if self.addon_chart_version in existing_tags:
+                logger.info("Chart %s:%s already exists in ECR at %s/%s; skipping chart push.", self.addon_chart, self.addon_chart_version, self.private_ecr_url, repo_path)
+                return
+        else:
+            # Repository known to be missing from this run's listing: create it without asking ECR first
+            known_repos = type(self)._ecr_repository_names
+            repo_missing = known_repos is not None and repo_path not in known_repos
+            if not repo_missing:
+                published = self._chart_tag_in_ecr(repo_path)
+                if published:
+                    logger.info("Chart %s:%s already exists in ECR at %s/%s; skipping chart push.", self.addon_chart, self.addon_chart_version, self.private_ecr_url, repo_path)
+                    return
+                repo_missing = published is None
+            if repo_missing:
+                logger.info("Repository %s/%s not found, creating new repository...", self.private_ecr_url, repo_path)
                 try:
                     self.ecr_client.create_repository(repositoryName=repo_path, tags=[{"Key": "chart-syncer", "Value": "true"}])
+                    self._wait_for_ecr_repository(repo_path)
                 except ClientError as create_err:
-                    logger.error(f"Unable to create ECR repository: {create_err}")
+                    if create_err.response["Error"]["Code"] != "RepositoryAlreadyExistsException":
+                        logger.error("Unable to create ECR repository: %s", create_err)
+                        raise Exception(f"Unable to create ECR repository: {create_err}")
+                    # The listing was stale: the repository existed and may already hold this version
+                    if self._chart_tag_in_ecr(repo_path):
+                        logger.info("Chart %s:%s already exists in ECR at %s/%s; skipping chart push.", self.addon_chart, self.addon_chart_version, self.private_ecr_url, repo_path)
+                        if known_repos is not None:
+                            known_repos.add(repo_path)
+                        return
+                except BotoCoreError as create_err:
+                    logger.error("Unable to create ECR repository: %s", create_err)
                     raise Exception(f"Unable to create ECR repository: {create_err}")
-            else:
-                logger.error(f"Error describing ECR repositories: {e}")
-                raise Exception(f"Error describing ECR repositories: {e}")
-
-        # Skip chart push if this version already exists (tagged) in ECR
-        try:
-            self.ecr_client.describe_images(repositoryName=repo_path, imageIds=[{"imageTag": self.addon_chart_version}])
-            logger.info(f"Chart {self.addon_chart}:{self.addon_chart_version} already exists in ECR at {self.private_ecr_url}/{repo_path}; skipping chart push.")
-            return
-        except ClientError as e:
-            if e.response["Error"]["Code"] != "ImageNotFoundException":
-                logger.error(f"Error checking existing chart image: {e}")
-                raise Exception(f"Error checking existing chart image: {e}")
+                if known_repos is not None:
+                    known_repos.add(repo_path)
         # Helm registry login for private ECR using current AWS identity (sandboxed)
         try:
             self._login_ecr_private_chart()
         except Exception as e:
-            logger.warning(f"Helm registry login to private ECR failed; proceeding may fail: {e}")
+            logger.warning("Helm registry login to private ECR failed; proceeding may fail: %s", e)
 
         # Flattened chart push: push under chart name with no prefix
         dest_repo = f"oci://{self.private_ecr_url}/{ns}" if ns else f"oci://{self.private_ecr_url}"
+        args_push_chart = ["push", chart_file, dest_repo]
+        deadline = time.monotonic() + _PUSH_DEADLINE_SECONDS
+        destination_retried = False
         for attempt in range(retry_count):
+            errors = []
             try:
-                args_push_chart = ["push", chart_file, dest_repo]
-                result = self.run_helm(args_push_chart, "Failed to push chart to ECR")
+                result = self.run_helm(args_push_chart, "Failed to push chart to ECR", errors=errors, capture_stdout=False)
                 if result is not None:
-                    logger.info(f"Successfully pushed {self.private_ecr_url}/{repo_path}:{self.addon_chart_version}")
+                    logger.info("Successfully pushed %s/%s:%s", self.private_ecr_url, repo_path, self.addon_chart_version)
+                    if existing_tags is not None:
+                        existing_tags.add(self.addon_chart_version)
                     break
                 else:
-                    logger.warning(f"Attempt {attempt + 1} failed to push chart {chart_file} to {self.private_ecr_url}")
+                    logger.warning("Attempt %s failed to push chart %s to %s", attempt + 1, chart_file, self.private_ecr_url)
+                    if errors and _is_permanent_error(errors[-1]):
+                        # The destination is always private ECR: retry once after re-login and visibility wait
+                        if destination_retried:
+                            logger.error("Chart push to %s cannot succeed on retry; giving up: %s", self.private_ecr_url, errors[-1].strip())
+                            self.failed_push_addon_chart_images.add(chart_file)
+                            break
+                        destination_retried = True
+                        logger.warning("Private ECR rejected chart push; refreshing credentials and retrying once: %s", errors[-1].strip())
+                        self._recover_private_ecr_destination(repo_path, helm=True)
+                    remaining = deadline - time.monotonic()
+                    if attempt + 1 < retry_count and remaining <= 0:
+                        logger.error("Retry deadline (%.0fs) exceeded for pushing chart %s to %s.", _PUSH_DEADLINE_SECONDS, chart_file, self.private_ecr_url)
+                        self.failed_push_addon_chart_images.add(chart_file)
+                        break
+                    if attempt + 1 < retry_count and not _RETRY_BUCKET.try_acquire(_RETRY_COST):
+                        logger.error("Retry budget exhausted (too many failing registry operations); giving up on chart %s.", chart_file)
+                        self.failed_push_addon_chart_images.add(chart_file)
+                        break
                     if attempt + 1 < retry_count:
-                        logger.info(f"Retrying in {retry_delay} seconds...")
-                        time.sleep(retry_delay)
+                        delay = min(_backoff_delay(attempt, retry_delay), remaining)
+                        logger.info("Retrying in %.1f seconds...", delay)
+                        time.sleep(delay)
                     else:
-                        logger.error(f"Maximum attempts reached for pushing chart {chart_file} to {self.private_ecr_url}.")
-                        self.failed_push_addon_chart_images.append(chart_file)
+                        logger.error("Maximum attempts reached for pushing chart %s to %s.", chart_file, self.private_ecr_url)
+                        self.failed_push_addon_chart_images.add(chart_file)
             except Exception as e:
-                logger.error(f"Unexpected error occurred while pushing chart {chart_file} to {self.private_ecr_url}: {e}")
-                self.failed_push_addon_chart_images.append(chart_file)
+                logger.error("Unexpected error occurred while pushing chart %s to %s: %s", chart_file, self.private_ecr_url, e)
+                self.failed_push_addon_chart_images.add(chart_file)
+
+    # Attributes rendered by __str__, in order
+    _STR_FIELDS = (
+        "addon_chart",
+        "addon_chart_version",
+        "addon_chart_repository",
+        "addon_chart_repository_namespace",
+        "addon_chart_release_name",
+        "private_ecr_url",
+        "public_addon_chart_images",
+        "private_addon_chart_images",
+        "image_vulnerabilities",
+        "failed_pull_addon_chart_images",
+        "failed_push_addon_chart_images",
+        "failed_commands",
+    )
 
     def __str__(self):
         """
         Returns a string representation of the HelmChart instance.
-        """
-        return (f"addon_chart='{self.addon_chart}'\n"
-                f"addon_chart_version='{self.addon_chart_version}'\n"
-                f"addon_chart_repository='{self.addon_chart_repository}'\n"
-                f"addon_chart_repository_namespace='{self.addon_chart_repository_namespace}'\n"
-                f"addon_chart_release_name='{self.addon_chart_release_name}'\n"
-                f"private_ecr_url='{self.private_ecr_url}'\n"
-                f"public_addon_chart_images='{self.public_addon_chart_images}'\n"
-                f"private_addon_chart_images='{self.private_addon_chart_images}'\n"
-                f"image_vulnerabilities='{self.image_vulnerabilities}'\n"
-                f"failed_pull_addon_chart_images='{self.failed_pull_addon_chart_images}'\n"
-                f"failed_push_addon_chart_images='{self.failed_push_addon_chart_images}'\n"
-                f"failed_commands='{self.failed_commands}'\n")
+        Built with a single join; pass the instance as a logging argument
+        (logger.debug("chart: %s", chart)) so it is only rendered when the record is emitted.
+        """
+        lines = []
+        for name in self._STR_FIELDS:
+            value = getattr(self, name)
+            if isinstance(value, set):
+                value = sorted(value)
+            lines.append(f"{name}='{value}'\n")
+        return "".join(lines)
@@ -2,15 +2,29 @@ import argparse
 import logging
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Tuple
 
 import boto3
-from botocore.exceptions import ClientError
+from botocore.config import Config
+from botocore.exceptions import BotoCoreError, ClientError
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(levelname)s:%(name)s:%(message)s")
 logger = logging.getLogger("ecr_cleanup")
 
+# Upper bound on concurrent list_tags_for_resource calls when selecting repositories
+_MAX_TAG_LOOKUP_WORKERS = 16
+
+# Adaptive client-side retries (absorbs ECR throttling) with short connect/read timeouts
+_AWS_CLIENT_CONFIG = Config(
+    retries={"mode": "adaptive", "max_attempts": 10},
+    connect_timeout=3,
+    read_timeout=10,
+    tcp_keepalive=True,
+    max_pool_connections=_MAX_TAG_LOOKUP_WORKERS,
+)
+
 
 def list_repositories(ecr_client) -> List[dict]:
     """
@@ -32,7 +46,8 @@ def has_chart_syncer_tag(ecr_client, repo_arn: str) -> bool:
         for tag in resp.get("tags", []):
             if tag.get("Key") == "chart-syncer" and str(tag.get("Value")).lower() == "true":
                 return True
-    except ClientError as e:
+    except (ClientError, BotoCoreError) as e:
+        # Includes connect/read timeouts; only this repository is skipped
         logger.warning(f"Unable to list tags for {repo_arn}: {e}")
     return False
 
@@ -46,15 +61,16 @@ def select_candidates(ecr_client, repositories: List[dict], delete_all: bool) ->
     for repo in repositories:
         name = repo.get("repositoryName")
         arn = repo.get("repositoryArn")
-        if not name or not arn:
-            continue
-        if delete_all:
+        if name and arn:
             candidates.append((name, arn))
-        else:
-            # Default: only repos created by this tool (chart-syncer=true)
-            if has_chart_syncer_tag(ecr_client, arn):
-                candidates.append((name, arn))
-    return candidates
+    if delete_all or not candidates:
+        return candidates
+
+    # Default: only repos created by this tool (chart-syncer=true).
+    # Tag lookups are independent API calls, so issue them concurrently.
+    with ThreadPoolExecutor(max_workers=min(len(candidates), _MAX_TAG_LOOKUP_WORKERS)) as pool:
+        tagged = list(pool.map(lambda c: has_chart_syncer_tag(ecr_client, c[1]), candidates))
+    return [c for c, is_tagged in zip(candidates, tagged) if is_tagged]
 
 
 def delete_repositories(ecr_client, repos: List[Tuple[str, str]]) -> Tuple[List[str], List[Tuple[str, str, str]]]:
@@ -113,7 +129,7 @@ def main():
     if not region:
         logger.error("No AWS region detected. Set AWS_DEFAULT_REGION or configure a default region (aws configure).")
         sys.exit(1)
-    sts = session.client("sts", region_name=region)
+    sts = session.client("sts", region_name=region, config=_AWS_CLIENT_CONFIG)
     try:
         identity = sts.get_caller_identity()
         account = identity.get("Account")
@@ -122,7 +138,7 @@ def main():
         logger.error(f"Unable to get AWS caller identity: {e}")
         sys.exit(1)
 
-    ecr = session.client("ecr", region_name=region)
+    ecr = session.client("ecr", region_name=region, config=_AWS_CLIENT_CONFIG)
 
     try:
         all_repos = list_repositories(ecr)
@@ -3,9 +3,10 @@ import logging
 import os
 import sys
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 from image_yaml import extract_chart_values_image, convert_dict_to_yaml
-from chart import HelmChart, configure_colored_logging, set_log_context, clear_log_context
+from chart import HelmChart, configure_colored_logging, set_log_context, clear_log_context, thread_log_context
 from values_parser import discover_addons_in_values, load_catalog
 from colorama import Fore, Style
 
@@ -14,22 +15,90 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 # Enable colored, contextual logging
 configure_colored_logging()
+# Upper bound on charts resolved/downloaded concurrently before processing
+_MAX_PREFETCH_WORKERS = 8
 
-def check_dependencies(will_push: bool) -> None:
+def check_dependencies() -> None:
     """
-    Ensure required CLI tools are available on PATH.
-    Always require: helm, yq, crane
-    Require when pushing: aws
+    Ensure required CLI tools are available on PATH: helm, yq, crane.
+    ECR tokens and caller identity come from boto3, so the aws CLI is not needed.
     Exits the program with an error if any are missing.
     """
     required = ["helm", "yq", "crane"]
-    if will_push:
-        required += ["aws"]
     missing = [cmd for cmd in required if shutil.which(cmd) is None]
     if missing:
         logger.error(f"Missing required CLI tools: {', '.join(missing)}. Install them and ensure they are on PATH.")
         sys.exit(1)
 
+def build_helm_chart(spec) -> HelmChart:
+    """
+    Create a HelmChart for an addon spec, configured from the CLI flags / environment.
+    """
+    helm_chart = HelmChart(
+        addon_chart=spec.get('chart'),
+        addon_chart_version=spec.get('version'),
+        addon_chart_repository=spec.get('repository'),
+        addon_chart_repository_namespace=spec.get('oci_namespace') or "",
+        addon_chart_release_name=spec.get('release') or ""
+    )
+    # Attach optional ECR password overrides (CLI flags or env vars)
+    helm_chart.public_ecr_password = args.public_ecr_password or os.getenv("ECR_PUBLIC_PASSWORD", "")
+    helm_chart.private_ecr_password = args.private_ecr_password or os.getenv("ECR_PRIVATE_PASSWORD", "")
+    # Platform preference
+    helm_chart.platform = args.platform
+    # Docker Hub credentials (optional)
+    helm_chart.dockerhub_username = args.dockerhub_username or os.getenv("DOCKERHUB_USERNAME", "")
+    helm_chart.dockerhub_token = args.dockerhub_token or os.getenv("DOCKERHUB_TOKEN", "")
+    # ECR preflight: skip/verify/overwrite existing destination tags
+    helm_chart.skip_existing = args.skip_existing
+    helm_chart.verify_existing_digest = args.verify_existing_digest
+    helm_chart.overwrite_existing = args.overwrite_existing
+    return helm_chart
+
+def prefetch_charts(charts) -> None:
+    """
+    Resolve versions and download chart archives (into the chart cache) for all addons
+    concurrently, so the per-chart pipeline below starts from local archives.
+    Charts sharing a name share a helm sandbox, so one worker handles them in order.
+    """
+    groups = {}
+    for _, helm_chart, pull_latest_flag in charts:
+        groups.setdefault(helm_chart.addon_chart, []).append((helm_chart, pull_latest_flag))
+    if not groups:
+        return
+
+    def _prefetch(group):
+        for helm_chart, pull_latest_flag in group:
+            # Workers run concurrently, so tag their log lines with the addon per thread
+            with thread_log_context(helm_chart.addon_chart, 0):
+                try:
+                    helm_chart.prefetch_chart(pull_latest_flag)
+                except Exception as e:
+                    # The per-chart pipeline retries and reports the failure
+                    logger.warning(f"Prefetch failed for {helm_chart.addon_chart}: {e}")
+
+    clear_log_context()
+    logger.info(f"Prefetching {len(charts)} charts...")
+    with ThreadPoolExecutor(max_workers=min(_MAX_PREFETCH_WORKERS, len(groups))) as pool:
+        list(pool.map(_prefetch, groups.values()))
+
+def prefetch_chart_tags(addons) -> None:
+    """
+    List existing chart versions in private ECR for every addon's repository up-front,
+    so each chart push can skip its own existence checks.
+    """
+    repo_names = []
+    for spec in addons:
+        chart = spec.get('chart')
+        if not chart:
+            continue
+        ns = (spec.get('oci_namespace') or "").strip("/")
+        repo_names.append(f"{ns}/{chart}" if ns else chart)
+    try:
+        HelmChart.prefetch_existing_tags(None, repo_names)
+    except Exception as e:
+        logger.warning(f"Failed to prefetch existing chart tags from ECR: {e}")
+
 def process_helm_chart(helm_chart: HelmChart, downloaded_chart_folder: str, scan_only: bool, push_images: bool, pull_latest_flag: bool, target_registry: Optional[str], repository_prefix: Optional[str], include_dependencies: bool):
     """
     Core pipeline to resolve version, download chart, extract and push images, and optionally push chart.
@@ -115,9 +184,9 @@ def process_helm_chart(helm_chart: HelmChart, downloaded_chart_folder: str, scan
             ]
         error_msgs = []
         if helm_chart.failed_pull_addon_chart_images:
-            error_msgs.append(f"Failed pulls: {helm_chart.failed_pull_addon_chart_images}")
+            error_msgs.append(f"Failed pulls: {sorted(helm_chart.failed_pull_addon_chart_images)}")
         if helm_chart.failed_push_addon_chart_images:
-            error_msgs.append(f"Failed pushes: {helm_chart.failed_push_addon_chart_images}")
+            error_msgs.append(f"Failed pushes: {sorted(helm_chart.failed_push_addon_chart_images)}")
         if helm_chart.failed_commands:
             last_cmd = helm_chart.failed_commands[-1] if helm_chart.failed_commands else None
             if last_cmd:
@@ -143,7 +212,7 @@ def main(scan_only: bool, push_images: bool, latest: bool = False, values_path:
 
     # Determine push behavior and verify dependencies upfront
     will_push = push_images or (not scan_only and not push_images)
-    check_dependencies(will_push)
+    check_dependencies()
 
     # Determine mode
     values_mode = bool(values_path) and os.path.exists(values_path)
@@ -195,28 +264,12 @@ def main(scan_only: bool, push_images: bool, latest: bool = False, values_path:
                         logger.warning("All addons excluded by --exclude-addons for this catalog; skipping.")
                         continue
 
-            for spec in addons:
-                helm_chart = HelmChart(
-                    addon_chart=spec.get('chart'),
-                    addon_chart_version=spec.get('version'),
-                    addon_chart_repository=spec.get('repository'),
-                    addon_chart_repository_namespace=spec.get('oci_namespace') or "",
-                    addon_chart_release_name=spec.get('release') or ""
-                )
-                # Attach optional ECR password overrides (CLI flags or env vars)
-                public_pw = args.public_ecr_password or os.getenv("ECR_PUBLIC_PASSWORD", "")
-                private_pw = args.private_ecr_password or os.getenv("ECR_PRIVATE_PASSWORD", "")
-                helm_chart.public_ecr_password = public_pw
-                helm_chart.private_ecr_password = private_pw
-                # Platform preference
-                helm_chart.platform = args.platform
-                # Docker Hub credentials (optional)
-                helm_chart.dockerhub_username = args.dockerhub_username or os.getenv("DOCKERHUB_USERNAME", "")
-                helm_chart.dockerhub_token = args.dockerhub_token or os.getenv("DOCKERHUB_TOKEN", "")
-
-                # If version is not specified in catalog, force pull_latest for this chart
-                pull_latest_flag = latest or (not bool(spec.get('version')))
-
+            if will_push:
+                prefetch_chart_tags(addons)
+            # If version is not specified in catalog, force pull_latest for that chart
+            charts = [(spec, build_helm_chart(spec), latest or (not bool(spec.get('version')))) for spec in addons]
+            prefetch_charts(charts)
+            for spec, helm_chart, pull_latest_flag in charts:
                 result = process_helm_chart(
                     helm_chart=helm_chart,
                     downloaded_chart_folder=downloaded_chart_folder,
@@ -277,28 +330,12 @@ def main(scan_only: bool, push_images: bool, latest: bool = False, values_path:
                 if not addons:
                     logger.warning("All addons excluded by --exclude-addons; exiting.")
                     return
-        for spec in addons:
-            helm_chart = HelmChart(
-                addon_chart=spec.get('chart'),
-                addon_chart_version=spec.get('version'),
-                addon_chart_repository=spec.get('repository'),
-                addon_chart_repository_namespace=spec.get('oci_namespace') or "",
-                addon_chart_release_name=spec.get('release') or ""
-            )
-            # Attach optional ECR password overrides (CLI flags or env vars)
-            public_pw = args.public_ecr_password or os.getenv("ECR_PUBLIC_PASSWORD", "")
-            private_pw = args.private_ecr_password or os.getenv("ECR_PRIVATE_PASSWORD", "")
-            helm_chart.public_ecr_password = public_pw
-            helm_chart.private_ecr_password = private_pw
-            # Platform preference
-            helm_chart.platform = args.platform
-            # Docker Hub credentials (optional)
-            helm_chart.dockerhub_username = args.dockerhub_username or os.getenv("DOCKERHUB_USERNAME", "")
-            helm_chart.dockerhub_token = args.dockerhub_token or os.getenv("DOCKERHUB_TOKEN", "")
-
-            # If version is not specified in values, force pull_latest for this chart
-            pull_latest_flag = latest or (not bool(spec.get('version')))
-
+        if will_push:
+            prefetch_chart_tags(addons)
+        # If version is not specified in values, force pull_latest for that chart
+        charts = [(spec, build_helm_chart(spec), latest or (not bool(spec.get('version')))) for spec in addons]
+        prefetch_charts(charts)
+        for spec, helm_chart, pull_latest_flag in charts:
             result = process_helm_chart(
                 helm_chart=helm_chart,
                 downloaded_chart_folder=downloaded_chart_folder,
@@ -0,0 +1,53 @@
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+
+import chart  # noqa: E402
+
+
+def _cache_path(repository, namespace, name="demo", version="1.0.0"):
+    return chart.HelmChart(name, version, repository, namespace, name)._chart_cache_path(version)
+
+
+def test_oci_namespaces_get_separate_cache_entries():
+    assert _cache_path("oci://ghcr.io", "org-a/charts") != _cache_path("oci://ghcr.io", "org-b/charts")
+
+
+def test_cache_key_depends_on_repository_and_version():
+    assert _cache_path("https://a.example.com/charts", "") != _cache_path("https://b.example.com/charts", "")
+    assert _cache_path("https://a.example.com/charts", "", version="1.0.0") != _cache_path("https://a.example.com/charts", "", version="1.0.1")
+
+
+def test_cache_key_is_stable_and_named_after_the_chart():
+    path = _cache_path("oci://ghcr.io", "org-a/charts")
+    assert path == _cache_path("oci://ghcr.io", "org-a/charts")
+    assert os.path.basename(path) == "demo-1.0.0.tgz"
+
+
+def test_store_then_restore_round_trip():
+    with tempfile.TemporaryDirectory() as tmp:
+        pulled = os.path.join(tmp, "pulled.tgz")
+        cached = os.path.join(tmp, "cache", "demo-1.0.0.tgz")
+        restored = os.path.join(tmp, "out", "demo-1.0.0.tgz")
+        os.makedirs(os.path.dirname(cached))
+        os.makedirs(os.path.dirname(restored))
+        with open(pulled, "wb") as f:
+            f.write(b"archive")
+        chart.HelmChart._store_cached_chart(pulled, cached)
+        assert not os.path.exists(f"{cached}.tmp")
+        assert chart.HelmChart._restore_cached_chart(cached, restored)
+        with open(restored, "rb") as f:
+            assert f.read() == b"archive"
+
+
+def test_restore_misses_on_absent_or_empty_entries():
+    with tempfile.TemporaryDirectory() as tmp:
+        cached = os.path.join(tmp, "demo-1.0.0.tgz")
+        target = os.path.join(tmp, "target.tgz")
+        assert not chart.HelmChart._restore_cached_chart(cached, target)
+        open(cached, "wb").close()
+        assert not chart.HelmChart._restore_cached_chart(cached, target)
+        assert not os.path.exists(target)
@@ -0,0 +1,49 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+
+import chart  # noqa: E402
+
+
+def _images(docs):
+    found = []
+
+    def visit(node):
+        if isinstance(node, dict):
+            if isinstance(node.get("image"), str):
+                found.append(node["image"])
+            for v in node.values():
+                visit(v)
+        elif isinstance(node, list):
+            for v in node:
+                visit(v)
+
+    for d in docs:
+        visit(d)
+    return found
+
+
+def test_parse_image_documents_keeps_flow_style_manifests():
+    rendered = "\n".join([
+        "---",
+        "apiVersion: v1",
+        "kind: ServiceAccount",
+        "metadata: {name: demo}",
+        "---",
+        "apiVersion: v1",
+        "kind: Pod",
+        'spec: {"containers":[{"image":"nginx:1.2"}]}',
+        "---",
+        "apiVersion: apps/v1",
+        "kind: Deployment",
+        "spec:",
+        "  template:",
+        "    spec:",
+        "      containers:",
+        "        - image: busybox:1.36",
+    ])
+    docs = chart._parse_image_documents(rendered, "demo")
+    assert len(docs) == 2
+    assert sorted(_images(docs)) == ["busybox:1.36", "nginx:1.2"]
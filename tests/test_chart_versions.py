@@ -0,0 +1,47 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+
+import chart  # noqa: E402
+
+
+def _resolve(requested, versions, pull_latest=False):
+    hc = chart.HelmChart("redis", requested, "https://charts.example.com", "", "redis")
+    hc._repo_chart_versions = lambda: versions
+    return hc.get_remote_version(pull_latest=pull_latest), hc.addon_chart_version
+
+
+def test_requested_version_present_is_kept():
+    assert _resolve("1.1.0", ["1.2.0", "1.1.0", "1.0.0"]) == ("1.1.0", "1.1.0")
+
+
+def test_requested_version_absent_falls_back_to_newest_stable():
+    assert _resolve("9.9.9", ["2.0.0-rc.1", "1.2.0", "1.1.0"]) == ("1.2.0", "1.2.0")
+
+
+def test_pull_latest_skips_prereleases():
+    assert _resolve("1.0.0", ["2.0.0-rc.1", "1.2.0"], pull_latest=True) == ("1.2.0", "1.2.0")
+
+
+def test_prerelease_only_repo_uses_newest_prerelease():
+    assert _resolve("1.0.0", ["2.0.0-rc.2", "2.0.0-rc.1"], pull_latest=True) == ("2.0.0-rc.2", "2.0.0-rc.2")
+
+
+def test_build_metadata_with_hyphen_is_not_a_prerelease():
+    assert not chart._is_prerelease("1.2.3+build-7")
+    assert not chart._is_prerelease("0.9.0+up-1")
+    assert chart._is_prerelease("1.2.3-rc.1+build-7")
+    assert _resolve("1.0.0", ["1.2.3+build-7", "1.2.2"], pull_latest=True) == ("1.2.3+build-7", "1.2.3+build-7")
+
+
+def test_search_results_keep_exact_chart_name_only():
+    entries = [
+        {"name": "bitnami/redis-cluster", "version": "10.0.0"},
+        {"name": "bitnami/redis", "version": "19.0.0"},
+        {"name": "bitnami/redis", "version": "18.6.1"},
+        {"name": "bitnami/redis"},
+        "not-an-entry",
+    ]
+    assert chart._exact_search_versions(entries, "bitnami/redis") == ["19.0.0", "18.6.1"]
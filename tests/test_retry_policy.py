@@ -0,0 +1,67 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+
+import chart  # noqa: E402
+
+
+def test_permanent_errors_are_not_retried():
+    assert chart._is_permanent_error("GET https://ghcr.io/v2/x/manifests/1: MANIFEST_UNKNOWN: manifest unknown")
+    assert chart._is_permanent_error("UNAUTHORIZED: authentication required")
+    assert chart._is_permanent_error("Error: DENIED: requested access to the resource is denied")
+
+
+def test_transient_errors_are_retried():
+    assert not chart._is_permanent_error("TOOMANYREQUESTS: rate limit exceeded")
+    assert not chart._is_permanent_error("net/http: TLS handshake timeout")
+    assert not chart._is_permanent_error("unexpected status code 503 Service Unavailable")
+
+
+def test_transient_wins_when_both_appear():
+    assert not chart._is_permanent_error("denied: too many requests, retry later")
+
+
+def test_unknown_and_empty_errors_are_retried():
+    assert not chart._is_permanent_error("")
+    assert not chart._is_permanent_error(None)
+    assert not chart._is_permanent_error("something odd happened")
+
+
+def test_backoff_delay_is_jittered_and_capped():
+    for attempt in range(10):
+        for _ in range(50):
+            delay = chart._backoff_delay(attempt, 1.0, cap=8.0)
+            assert 0 <= delay <= min(8.0, 2 ** attempt)
+
+
+def test_retry_bucket_spends_and_refills(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr(chart.time, "monotonic", lambda: clock[0])
+    bucket = chart._RetryTokenBucket(capacity=10, refill_per_sec=2)
+    assert bucket.try_acquire(5)
+    assert bucket.try_acquire(5)
+    assert not bucket.try_acquire(5)
+    clock[0] += 1.0
+    assert not bucket.try_acquire(5)
+    clock[0] += 2.0
+    assert bucket.try_acquire(5)
+
+
+def test_retry_bucket_never_exceeds_capacity(monkeypatch):
+    clock = [0.0]
+    monkeypatch.setattr(chart.time, "monotonic", lambda: clock[0])
+    bucket = chart._RetryTokenBucket(capacity=10, refill_per_sec=100)
+    clock[0] += 60.0
+    assert bucket.try_acquire(10)
+    assert not bucket.try_acquire(1)
+
+
+def test_only_private_ecr_errors_count_as_destination_errors():
+    hc = chart.HelmChart("demo", "1.0.0", "https://charts.example.com", "", "demo")
+    hc.private_ecr_url = "123456789012.dkr.ecr.us-east-1.amazonaws.com"
+    assert hc._is_private_ecr_error("PUT https://123456789012.dkr.ecr.us-east-1.amazonaws.com/v2/x/manifests/1: DENIED")
+    assert not hc._is_private_ecr_error("GET https://ghcr.io/token: UNAUTHORIZED")
+    hc.private_ecr_url = None
+    assert not hc._is_private_ecr_error("DENIED")